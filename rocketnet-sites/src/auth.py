@@ -2,11 +2,24 @@
 Simple Authentication for Rocket.net API
 """
 
+import asyncio
+import hashlib
+import importlib.util
 import os
 import logging
-from typing import Optional, Dict, Any
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Union, AsyncIterator, Deque, Mapping, Tuple
 import httpx
 
+try:
+    import orjson
+except ImportError:  # Optional - the stdlib json module is used instead
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +28,242 @@ class AuthenticationError(Exception):
     pass
 
 
+class RateLimitError(Exception):
+    """The API rejected a request for exceeding the rate limit (429)."""
+    pass
+
+
+class ServerError(Exception):
+    """The API failed to handle a request (5xx)."""
+    pass
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit for fan-out requests that adapts to the API (AIMD).
+
+    The limit grows by `increase` after each request that finishes within
+    target_latency, and halves after a slow request, a 429 or a 5xx, always
+    staying between min_limit and max_limit.
+    """
+
+    def __init__(
+        self,
+        limit: float = 8,
+        min_limit: int = 2,
+        max_limit: int = 32,
+        target_latency: float = 2.0,
+        increase: float = 0.5
+    ):
+        self.limit = float(limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_latency = target_latency
+        self.increase = increase
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _record(self, latency: float, overloaded: bool) -> None:
+        """Adjust the limit after a request completes."""
+        if overloaded or latency > self.target_latency:
+            self.limit = max(float(self.min_limit), self.limit / 2)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + self.increase)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free slot under the current limit and hold it for one request."""
+        # The condition belongs to the loop that first waited on it - start
+        # afresh under a new loop, as get_client does for its connections
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._in_flight = 0
+            self._loop = loop
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+        started = time.monotonic()
+        overloaded = False
+        try:
+            yield
+        except (RateLimitError, ServerError):
+            overloaded = True
+            raise
+        finally:
+            self._in_flight -= 1
+            self._record(time.monotonic() - started, overloaded)
+            async with self._condition:
+                self._condition.notify_all()
+
+
+# Shared across batches so concurrent fan-outs back off together
+api_limiter = AdaptiveLimiter()
+
+
+class RateLimiter:
+    """
+    Client-side view of the API rate limit.
+
+    Requests wait here before they are sent: while a Retry-After or an
+    exhausted X-RateLimit-Remaining window is in effect, and - when
+    ROCKETNET_RATE_LIMIT_REQUESTS is set - while the sliding window of
+    recent requests is full.
+    """
+
+    def __init__(self, requests: int = 0, period: float = 60.0):
+        self.requests = requests
+        self.period = period
+        self._sent: Deque[float] = deque()
+        self._blocked_until = 0.0
+
+    async def wait(self) -> None:
+        """Sleep until a request may be sent, then count it."""
+        while True:
+            now = time.monotonic()
+            if self._blocked_until > now:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            if self.requests > 0:
+                while self._sent and now - self._sent[0] >= self.period:
+                    self._sent.popleft()
+                if len(self._sent) >= self.requests:
+                    await asyncio.sleep(self.period - (now - self._sent[0]))
+                    continue
+                self._sent.append(now)
+            return
+
+    def block_for(self, seconds: float) -> None:
+        """Hold back every request for the given number of seconds."""
+        if seconds > 0:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Pause until the window resets once the API reports none remaining."""
+        try:
+            remaining = int(headers["x-ratelimit-remaining"])
+            reset = float(headers["x-ratelimit-reset"])
+        except (KeyError, ValueError):
+            return
+        if remaining <= 0:
+            # Reset is either an epoch timestamp or seconds from now
+            self.block_for(reset - time.time() if reset > 1e9 else reset)
+
+    @staticmethod
+    def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds to wait according to a Retry-After header, if present."""
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+rate_limiter = RateLimiter(
+    requests=int(os.getenv("ROCKETNET_RATE_LIMIT_REQUESTS", "0")),
+    period=float(os.getenv("ROCKETNET_RATE_LIMIT_PERIOD", "60"))
+)
+
+# How many times a 429 is retried after waiting out its Retry-After
+RATE_LIMIT_RETRIES = 2
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Shared HTTP client - keeps connections to the API alive between tool calls
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Connection pool sizing - enough keep-alive connections for batched
+# fan-out (see batch_get) without opening a fresh one per request
+CLIENT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=16, keepalive_expiry=75.0)
+CLIENT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Multiplex concurrent requests over one connection where the API supports
+# it; httpx needs the optional h2 package (httpx[http2]) for this
+CLIENT_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Reusing a single client lets every request ride on pooled keep-alive
+    connections instead of paying a fresh TCP/TLS handshake per call.
+    Must be called from inside a running event loop.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them, so a new
+    # event loop (e.g. repeated asyncio.run() in scripts) gets a new client
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(timeout=CLIENT_TIMEOUT, limits=CLIENT_LIMITS, http2=CLIENT_HTTP2)
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (called on server shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+@lru_cache(maxsize=1)
+def _env_credentials() -> Tuple[Optional[str], Optional[str]]:
+    """Username and password from the environment, read once."""
+    username = os.getenv("ROCKETNET_USERNAME") or os.getenv("ROCKETNET_EMAIL")
+    return username, os.getenv("ROCKETNET_PASSWORD")
+
+
+def reset_env_cache() -> None:
+    """Re-read credentials from the environment on next use (e.g. in tests)."""
+    _env_credentials.cache_clear()
+
+
+def resolve_credentials(
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """The username and password a request will log in with, after the env fallback."""
+    env_username, env_password = _env_credentials()
+    return username or env_username, password or env_password
+
+
+def credentials_fingerprint(
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> str:
+    """
+    Identify the credentials a request will log in with, for cache keys.
+
+    Covers the password as well as the username, so a cached read is only
+    served to a caller presenting the same credentials that fetched it.
+    """
+    final_username, final_password = resolve_credentials(username, password)
+    return hashlib.sha256(f"{final_username or ''}\0{final_password or ''}".encode()).hexdigest()
+
+
 async def login_to_rocketnet(
     username: Optional[str] = None,
     password: Optional[str] = None,
@@ -36,8 +285,7 @@ async def login_to_rocketnet(
         ValueError: If credentials are missing
     """
     # Get credentials from params or environment
-    final_username = username or os.getenv("ROCKETNET_USERNAME") or os.getenv("ROCKETNET_EMAIL")
-    final_password = password or os.getenv("ROCKETNET_PASSWORD")
+    final_username, final_password = resolve_credentials(username, password)
 
     if not final_username or not final_password:
         raise ValueError(
@@ -60,29 +308,31 @@ async def login_to_rocketnet(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            logger.debug(f"Attempting login for user: {final_username}")
-            response = await client.post(
-                login_url,
-                json=payload,
-                headers=headers
-            )
+        client = get_client()
+        logger.debug(f"Attempting login for user: {final_username}")
+        await rate_limiter.wait()
+        response = await client.post(
+            login_url,
+            json=payload,
+            headers=headers
+        )
+        rate_limiter.update(response.headers)
 
-            if response.status_code == 200:
-                data = response.json()
-                token = data.get("token")
-                if not token:
-                    raise AuthenticationError("No token in response")
-                logger.info("Successfully authenticated with Rocket.net")
-                return token
-            elif response.status_code == 401:
-                raise AuthenticationError("Invalid username or password")
-            elif response.status_code == 400:
-                raise AuthenticationError("Invalid request format")
-            else:
-                raise AuthenticationError(
-                    f"Authentication failed with status {response.status_code}: {response.text}"
-                )
+        if response.status_code == 200:
+            data = _decode_json(response)
+            token = data.get("token")
+            if not token:
+                raise AuthenticationError("No token in response")
+            logger.info("Successfully authenticated with Rocket.net")
+            return token
+        elif response.status_code == 401:
+            raise AuthenticationError("Invalid username or password")
+        elif response.status_code == 400:
+            raise AuthenticationError("Invalid request format")
+        else:
+            raise AuthenticationError(
+                f"Authentication failed with status {response.status_code}: {response.text}"
+            )
 
     except httpx.RequestError as e:
         logger.error(f"Network error during authentication: {e}")
@@ -150,6 +400,57 @@ async def make_api_request(
     # Get auth headers (this handles login automatically)
     headers = await get_auth_headers(username, password, api_base)
 
+    return await _send_request(method, endpoint, headers, json_data, params, api_base)
+
+
+async def batch_get(
+    endpoints: List[str],
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    concurrency: int = 10,
+    api_base: str = "https://api.rocket.net/v1"
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    GET several endpoints with a single login.
+
+    The API has no multi-resource endpoint, so the requests are issued
+    concurrently over the shared connection pool, reusing one token instead
+    of logging in once per endpoint.
+
+    Args:
+        endpoints: API endpoints to fetch (e.g., ["/sites/1/status", "/sites/2/status"])
+        username: Rocket.net username (optional, uses env var if not provided)
+        password: Rocket.net password (optional, uses env var if not provided)
+        concurrency: Maximum number of this batch's requests in flight at once
+            (the shared api_limiter may allow fewer while the API is struggling)
+        api_base: Base API URL
+
+    Returns:
+        Response data for each endpoint, in order. A request that failed is
+        returned as its exception instead of being raised.
+
+    Raises:
+        AuthenticationError: For auth failures
+    """
+    headers = await get_auth_headers(username, password, api_base)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _get(endpoint: str) -> Dict[str, Any]:
+        async with semaphore, api_limiter.slot():
+            return await _send_request("GET", endpoint, headers, api_base=api_base)
+
+    return await asyncio.gather(*[_get(endpoint) for endpoint in endpoints], return_exceptions=True)
+
+
+async def _send_request(
+    method: str,
+    endpoint: str,
+    headers: Dict[str, str],
+    json_data: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    api_base: str = "https://api.rocket.net/v1"
+) -> Dict[str, Any]:
+    """Send a request with ready-made auth headers and decode the response."""
     # Ensure endpoint starts with /
     if not endpoint.startswith("/"):
         endpoint = f"/{endpoint}"
@@ -158,7 +459,9 @@ async def make_api_request(
     url = f"{api_base}{endpoint}"
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        client = get_client()
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await rate_limiter.wait()
             response = await client.request(
                 method=method.upper(),
                 url=url,
@@ -166,26 +469,36 @@ async def make_api_request(
                 json=json_data,
                 params=params
             )
+            rate_limiter.update(response.headers)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+
+            # Rejected requests were not processed, so waiting and resending is safe
+            delay = rate_limiter.retry_after(response.headers)
+            if delay is None:
+                delay = DEFAULT_RETRY_AFTER
+            rate_limiter.block_for(delay)
+            logger.warning(f"Rate limited on {endpoint}, retrying in {delay:.1f}s")
 
-            # Handle response
-            if response.status_code == 200:
-                return response.json()
-            elif response.status_code == 201:
-                return response.json()
-            elif response.status_code == 204:
-                return {"success": True, "message": "Operation completed"}
-            elif response.status_code == 404:
-                raise Exception(f"Resource not found: {endpoint}")
-            elif response.status_code == 400:
-                raise Exception(f"Bad request: {response.text}")
-            elif response.status_code == 401:
-                raise AuthenticationError("Authentication failed - invalid token")
-            elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
-            elif response.status_code >= 500:
-                raise Exception(f"Server error: {response.status_code}")
-            else:
-                raise Exception(f"Unexpected response: {response.status_code} - {response.text}")
+        # Handle response
+        if response.status_code == 200:
+            return _decode_json(response)
+        elif response.status_code == 201:
+            return _decode_json(response)
+        elif response.status_code == 204:
+            return {"success": True, "message": "Operation completed"}
+        elif response.status_code == 404:
+            raise Exception(f"Resource not found: {endpoint}")
+        elif response.status_code == 400:
+            raise Exception(f"Bad request: {response.text}")
+        elif response.status_code == 401:
+            raise AuthenticationError("Authentication failed - invalid token")
+        elif response.status_code == 429:
+            raise RateLimitError("Rate limit exceeded")
+        elif response.status_code >= 500:
+            raise ServerError(f"Server error: {response.status_code}")
+        else:
+            raise Exception(f"Unexpected response: {response.status_code} - {response.text}")
 
     except httpx.RequestError as e:
         logger.error(f"Network error: {e}")
@@ -4,12 +4,26 @@ Rocket.net Sites Management MCP Server
 Core site operations including creation, configuration, and monitoring.
 """
 
+import asyncio
+import json
+import logging
 import os
 import sys
+import time
+from contextlib import asynccontextmanager, suppress
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Set, Tuple, Union
 
 from fastmcp import FastMCP
-from utils import format_success, format_error
+
+# Make src/ importable once, so the tool modules don't each patch sys.path
+SRC_DIR = str(Path(__file__).parent)
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from auth import make_api_request, batch_get, close_client, credentials_fingerprint
+from utils import format_success, format_error, api_cache, pick, to_json, unwrap
 
 # Import tools
 from tools.sites import (
@@ -19,6 +33,7 @@ from tools.sites import (
     update_site,
     delete_site,
     get_site_status,
+    get_sites_status_bulk,
     clone_site,
     get_site_settings,
     update_site_settings,
@@ -37,6 +52,30 @@ from tools.plans import (
 
 # Resources are now handled directly in server.py
 
+
+logger = logging.getLogger(__name__)
+
+# Set ROCKETNET_PREWARM_STATUS=true to keep sites://all/status warm in the background
+PREWARM_STATUS = os.getenv("ROCKETNET_PREWARM_STATUS", "").lower() in ("1", "true", "yes")
+ALL_SITES_STATUS_KEY = ("/sites", "status")
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Optionally prewarm the all-sites status, and release the shared API client on shutdown."""
+    prewarm = None
+    if PREWARM_STATUS and api_cache.ttl > 0:
+        prewarm = asyncio.create_task(_prewarm_all_sites_status())
+    try:
+        yield
+    finally:
+        if prewarm is not None:
+            prewarm.cancel()
+            with suppress(asyncio.CancelledError):
+                await prewarm
+        await close_client()
+
+
 # Initialize FastMCP server - MUST be at module level for FastMCP Cloud
 mcp = FastMCP(
     name="rocketnet-sites",
@@ -50,6 +89,7 @@ mcp = FastMCP(
     - update_site: Update site configuration
     - delete_site: Delete a site (use with caution)
     - get_site_status: Check site health and status
+    - get_sites_status_bulk: Check health and status for several sites at once
     - clone_site: Create a copy of an existing site
     - get_site_settings: Get site settings
     - update_site_settings: Update site settings
@@ -63,7 +103,8 @@ mcp = FastMCP(
 
     All operations require proper authentication via environment variables:
     ROCKETNET_USERNAME and ROCKETNET_PASSWORD
-    """
+    """,
+    lifespan=lifespan
 )
 
 # Register tools
@@ -73,6 +114,7 @@ mcp.tool(create_site)
 mcp.tool(update_site)
 mcp.tool(delete_site)
 mcp.tool(get_site_status)
+mcp.tool(get_sites_status_bulk)
 mcp.tool(clone_site)
 mcp.tool(get_site_settings)
 mcp.tool(update_site_settings)
@@ -82,58 +124,207 @@ mcp.tool(list_plans)
 mcp.tool(get_plan_details)
 mcp.tool(change_site_plan)
 
+async def _cached_json(key: Tuple[Any, ...], build: Callable[[], Awaitable[Dict[str, Any]]]) -> str:
+    """Return a resource's JSON from the shared cache, rebuilding it once the TTL expires."""
+    async def _render() -> str:
+        # Compact - consumers parse this, and pretty-printing roughly
+        # doubles the size of the all-sites payload
+        return to_json(await build())
+
+    # Resources log in with the env credentials - key on them, so a change
+    # of account never serves the previous account's data
+    return await api_cache.get_or_fetch((*key, credentials_fingerprint()), _render)
+
+
+async def _prewarm_all_sites_status() -> None:
+    """Keep sites://all/status cached, refreshing it every half TTL."""
+    interval = max(api_cache.ttl / 2, 1.0)
+    while True:
+        try:
+            api_cache.set(
+                (*ALL_SITES_STATUS_KEY, credentials_fingerprint()),
+                to_json(await get_all_sites_status())
+            )
+        except Exception as e:
+            # Leave the resource to fetch on demand; try again next round
+            logger.warning(f"Failed to prewarm all-sites status: {e}")
+        await asyncio.sleep(interval)
+
+
+# Status fields copied verbatim into each site dashboard
+DASHBOARD_STATUS_FIELDS = (
+    "uptime",
+    "response_time",
+    "ssl_status",
+    "last_backup",
+    "disk_usage",
+    "bandwidth_usage",
+)
+
+# Dashboard reads arriving within this window are fetched as one batch
+DASHBOARD_BATCH_WINDOW = 0.025
+_pending_dashboards: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+
+async def get_site_dashboard(site_id: str) -> Dict[str, Any]:
+    """
+    Build the dashboard for a single site.
+
+    Requests are collected for DASHBOARD_BATCH_WINDOW seconds so that
+    dashboards for several sites share one login and one concurrent batch.
+    Requests for the same site share a single result.
+    """
+    future = _pending_dashboards.get(site_id)
+    if future is None:
+        if not _pending_dashboards:
+            # First request of a new window schedules the flush
+            task = asyncio.create_task(_flush_dashboards())
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+        future = asyncio.get_running_loop().create_future()
+        _pending_dashboards[site_id] = future
+
+    # Shield so one cancelled caller doesn't cancel the result for the others
+    return await asyncio.shield(future)
+
+
+async def _flush_dashboards() -> None:
+    """Fetch every dashboard requested during the batch window."""
+    await asyncio.sleep(DASHBOARD_BATCH_WINDOW)
+    pending = dict(_pending_dashboards)
+    _pending_dashboards.clear()
+
+    endpoints = []
+    for site_id in pending:
+        endpoints.extend([f"/sites/{site_id}", f"/sites/{site_id}/status"])
+
+    try:
+        responses = await batch_get(endpoints)
+    except Exception as e:
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for i, (site_id, future) in enumerate(pending.items()):
+        if future.done():
+            continue
+        try:
+            future.set_result(_build_dashboard(site_id, responses[2 * i], responses[2 * i + 1]))
+        except Exception as e:
+            future.set_exception(e)
+
+
+def _build_dashboard(
+    site_id: str,
+    site_data: Union[Dict[str, Any], Exception],
+    status_data: Union[Dict[str, Any], Exception]
+) -> Dict[str, Any]:
+    """Assemble a site dashboard from the site and status responses."""
+    if isinstance(site_data, Exception):
+        raise site_data
+
+    # Status is best-effort - the site info alone is still a useful dashboard
+    if isinstance(status_data, Exception):
+        status = {"status": "unknown", "error": str(status_data)}
+    else:
+        status_data = status_data.get("result", status_data)
+        status = {
+            "status": status_data.get("status", "unknown"),
+            "health": status_data.get("health", "unknown"),
+            **pick(status_data, DASHBOARD_STATUS_FIELDS),
+            "issues": status_data.get("issues") or []
+        }
+
+    return {
+        "site_id": site_id,
+        "site": unwrap(site_data, "result", "site"),
+        "status": status
+    }
+
+
+async def get_all_sites_status() -> Dict[str, Any]:
+    """Build the status overview of all sites."""
+    # Get all sites
+    response = await make_api_request("GET", "/sites")
+    sites = unwrap(response, "result", "sites", "data", default=[])
+
+    # Check every site concurrently with one login, bounded so large
+    # accounts don't flood the API
+    status_responses = await batch_get([f"/sites/{site.get('id')}/status" for site in sites])
+
+    sites_status = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "summary": {
+            "total_sites": len(sites),
+            "active": 0,
+            "with_issues": 0,
+            "errors": 0
+        },
+        "sites": []
+    }
+    summary = sites_status["summary"]
+    keyed = []
+    for site, status_response in zip(sites, status_responses):
+        result = pick(site, ("id", "name", "domain"))
+        if result["domain"] is None:
+            result["domain"] = site.get("primary_domain")
+        if isinstance(status_response, Exception):
+            result.update({"status": "error", "error": str(status_response), "issues": 0})
+        else:
+            status_data = status_response.get("result", status_response)
+            result.update({
+                "status": status_data.get("status", "unknown"),
+                "health": status_data.get("health", "unknown"),
+                "issues": len(status_data.get("issues") or ())
+            })
+
+        if result["status"] == "error":
+            summary["errors"] += 1
+        elif result["status"] == "active":
+            summary["active"] += 1
+        if result["issues"]:
+            summary["with_issues"] += 1
+        # Errors first, then the sites with the most issues
+        keyed.append(((result["status"] != "error", -result["issues"], result["name"] or ""), result))
+
+    keyed.sort(key=itemgetter(0))
+    sites_status["sites"] = [result for _, result in keyed]
+    return sites_status
+
+
 # Register resources
 @mcp.resource("site://{site_id}/dashboard")
 async def site_dashboard_resource(site_id: str) -> str:
     """Get complete dashboard for a specific site."""
     try:
-        from auth import make_api_request
-        import json
-
-        # Get site info
-        site_data = await make_api_request("GET", f"/sites/{site_id}")
-
-        # Return formatted dashboard
-        dashboard = {
-            "site_id": site_id,
-            "site": site_data.get("site", site_data),
-            "status": "active"
-        }
-        return json.dumps(dashboard, indent=2)
+        return await _cached_json((f"/sites/{site_id}", "dashboard"), lambda: get_site_dashboard(site_id))
     except Exception as e:
-        import json
         return json.dumps({"error": str(e)}, indent=2)
 
 @mcp.resource("sites://all/status")
 async def all_sites_status_resource() -> str:
     """Get status overview of all sites."""
     try:
-        from auth import make_api_request
-        import json
-
-        # Get all sites
-        response = await make_api_request("GET", "/sites")
-        sites = response.get("sites", response.get("data", []))
-
-        # Return formatted status
-        status = {
-            "total_sites": len(sites),
-            "sites": sites
-        }
-        return json.dumps(status, indent=2)
+        return await _cached_json(ALL_SITES_STATUS_KEY, get_all_sites_status)
     except Exception as e:
-        import json
         return json.dumps({"error": str(e)}, indent=2)
 
 # Optional: Local testing
 if __name__ == "__main__":
-    import asyncio
-    import logging
-
     logging.basicConfig(level=logging.INFO)
 
     # For local testing only
     from dotenv import load_dotenv
     load_dotenv()
 
+    # uvloop is optional (not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    logging.info(f"Event loop policy: {type(asyncio.get_event_loop_policy()).__name__}")
+
     asyncio.run(mcp.run())
\ No newline at end of file
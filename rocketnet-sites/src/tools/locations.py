@@ -2,15 +2,13 @@
 Data Center Location Tools for Rocket.net
 """
 
-import sys
-from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-# Add parent directory to path for local imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from auth import make_api_request, credentials_fingerprint
+from utils import format_success, format_error, api_cache, cache_key
 
-from auth import make_api_request
-from utils import format_success, format_error
+# Data center locations change rarely - serve repeat lookups from memory
+LOCATIONS_CACHE_TTL = 86400
 
 
 async def list_locations(
@@ -28,18 +26,23 @@ async def list_locations(
         List of available locations with their details
     """
     try:
-        response = await make_api_request(
-            method="GET",
-            endpoint="/sites/locations",
-            username=username,
-            password=password
+        response = await api_cache.get_or_fetch(
+            cache_key("/sites/locations", credentials=credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint="/sites/locations",
+                username=username,
+                password=password
+            ),
+            ttl=LOCATIONS_CACHE_TTL
         )
         # API returns data in 'result' key
         locations = response.get("result", [])
 
         formatted_locations = []
+        recommended = None
         for loc in locations:
-            formatted_locations.append({
+            formatted = {
                 "id": loc.get("id"),
                 "name": loc.get("name"),
                 "region": loc.get("region"),
@@ -48,17 +51,21 @@ async def list_locations(
                 "available": loc.get("available", True),
                 "features": loc.get("features", []),
                 "latency_info": loc.get("latency_info"),
-            })
+            }
+            formatted_locations.append(formatted)
+            # Pick the API's recommended location while we're here
+            if recommended is None and loc.get("recommended"):
+                recommended = formatted
+
+        if recommended is None and formatted_locations:
+            recommended = formatted_locations[0]
 
         return format_success(
             f"Found {len(formatted_locations)} locations",
             {
                 "locations": formatted_locations,
                 "count": len(formatted_locations),
-                "recommended": next(
-                    (loc for loc in formatted_locations if loc.get("recommended")),
-                    formatted_locations[0] if formatted_locations else None
-                )
+                "recommended": recommended
             }
         )
 
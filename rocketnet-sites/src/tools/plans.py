@@ -2,20 +2,21 @@
 Hosting Plan Tools for Rocket.net
 """
 
-import sys
-from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-# Add parent directory to path for local imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from auth import make_api_request
+from auth import make_api_request, credentials_fingerprint
 from utils import (
     format_success,
     format_error,
     format_warning,
+    api_cache,
+    cache_key,
+    unwrap,
 )
 
+# The plan catalog changes rarely - serve repeat lookups from memory
+PLANS_CACHE_TTL = 3600
+
 
 async def list_plans(
     plan_type: Optional[str] = None,
@@ -38,12 +39,16 @@ async def list_plans(
         if plan_type:
             params["type"] = plan_type
 
-        response = await make_api_request(
-            method="GET",
-            endpoint="/billing/products",
-            params=params,
-            username=username,
-            password=password
+        response = await api_cache.get_or_fetch(
+            cache_key("/billing/products", params, credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint="/billing/products",
+                params=params,
+                username=username,
+                password=password
+            ),
+            ttl=PLANS_CACHE_TTL
         )
         # API returns data in 'result' key
         plans = response.get("result", [])
@@ -101,11 +106,15 @@ async def get_plan_details(
         Detailed plan information including all features
     """
     try:
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/billing/products/{plan_id}",
-            username=username,
-            password=password
+        response = await api_cache.get_or_fetch(
+            cache_key(f"/billing/products/{plan_id}", credentials=credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=f"/billing/products/{plan_id}",
+                username=username,
+                password=password
+            ),
+            ttl=PLANS_CACHE_TTL
         )
         # Single plan response is in 'result' key
         plan = response.get("result", response)
@@ -223,7 +232,11 @@ async def change_site_plan(
             password=password
         )
 
-        result = response.get("result", response.get("data", response))
+        result = unwrap(response, "result", "data")
+
+        # Cached views of this site are now out of date
+        api_cache.invalidate(f"/sites/{site_id}")
+        api_cache.invalidate("/sites", nested=False)
 
         return format_success(
             f"Plan changed from {current_plan} to {new_plan_id}",
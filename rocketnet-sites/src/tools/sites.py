@@ -2,26 +2,49 @@
 Site Management Tools for Rocket.net
 """
 
-import sys
-from pathlib import Path
+import asyncio
 from typing import Optional, Dict, Any, List
 
-# Add parent directory to path for local imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from auth import make_api_request
+from auth import make_api_request, batch_get, credentials_fingerprint
 from utils import (
     format_success,
     format_error,
     format_warning,
     format_site_info,
+    api_cache,
+    cache_key,
+    pick,
+)
+
+# Page size the API uses when per_page is not given
+DEFAULT_PER_PAGE = 10
+
+# Status fields passed through as-is by get_site_status
+STATUS_FIELDS = (
+    "uptime",
+    "response_time",
+    "ssl_status",
+    "last_backup",
+    "disk_usage",
+    "bandwidth_usage",
+    "php_version",
+    "wordpress_version",
 )
 
 
+def _invalidate_site(site_id: Optional[str] = None) -> None:
+    """Drop cached reads made stale by a write (the site list, plus one site's views)."""
+    api_cache.invalidate("/sites", nested=False)
+    if site_id is not None:
+        api_cache.invalidate(f"/sites/{site_id}")
+
+
 async def list_sites(
     status: Optional[str] = None,
     plan: Optional[str] = None,
     location: Optional[str] = None,
+    page: int = 1,
+    per_page: Optional[int] = None,
     username: Optional[str] = None,
     password: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -32,36 +55,52 @@ async def list_sites(
         status: Filter by site status (active, suspended, pending)
         plan: Filter by hosting plan
         location: Filter by data center location
+        page: Page of results to return (starts at 1)
+        per_page: Sites per page, 1-1000 (API default is 10)
         username: Rocket.net username (optional, uses env var if not provided)
         password: Rocket.net password (optional, uses env var if not provided)
 
     Returns:
-        List of sites with their basic information
+        One page of sites with their basic information, plus next_page
+        (None once the last page has been reached)
     """
     try:
-        params = {}
-        if status:
-            params["status"] = status
-        if plan:
-            params["plan"] = plan
-        if location:
-            params["location"] = location
-
-        response = await make_api_request(
-            method="GET",
-            endpoint="/sites",
-            username=username,
-            password=password,
-            params=params
+        filters = (
+            ("status", status),
+            ("plan", plan),
+            ("location", location),
+            ("page", page),
+            ("per_page", per_page),
+        )
+        params = {key: value for key, value in filters if value}
+
+        response = await api_cache.get_or_fetch(
+            cache_key("/sites", params, credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint="/sites",
+                username=username,
+                password=password,
+                params=params
+            )
         )
 
         # API returns data in 'result' key when using bearer token auth
         sites = response.get("result", [])
-        formatted_sites = [format_site_info(site) for site in sites]
+        formatted_sites = list(map(format_site_info, sites))
+
+        # A full page means there may be more to fetch
+        page_size = per_page or DEFAULT_PER_PAGE
+        next_page = page + 1 if len(sites) >= page_size else None
 
         return format_success(
             f"Found {len(formatted_sites)} sites",
-            {"sites": formatted_sites, "count": len(formatted_sites)}
+            {
+                "sites": formatted_sites,
+                "count": len(formatted_sites),
+                "page": page,
+                "next_page": next_page
+            }
         )
 
     except Exception as e:
@@ -85,11 +124,14 @@ async def get_site(
         Detailed site information including configuration and status
     """
     try:
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}",
-            username=username,
-            password=password
+        response = await api_cache.get_or_fetch(
+            cache_key(f"/sites/{site_id}", credentials=credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=f"/sites/{site_id}",
+                username=username,
+                password=password
+            )
         )
         # Single site response is in 'result' key
         site = response.get("result", response)
@@ -142,11 +184,8 @@ async def create_site(
             "php_version": php_version,
             "admin_username": admin_username
         }
-
-        if wordpress_version:
-            payload["wordpress_version"] = wordpress_version
-        if admin_email:
-            payload["admin_email"] = admin_email
+        optional = (("wordpress_version", wordpress_version), ("admin_email", admin_email))
+        payload.update((key, value) for key, value in optional if value)
 
         response = await make_api_request(
             method="POST",
@@ -155,6 +194,7 @@ async def create_site(
             password=password,
             json_data=payload
         )
+        _invalidate_site()
 
         # Single site response is in 'result' key
         site = response.get("result", response)
@@ -200,18 +240,14 @@ async def update_site(
         Updated site information
     """
     try:
-        payload = {}
-
-        if name:
-            payload["name"] = name
-        if php_version:
-            payload["php_version"] = php_version
-        if wordpress_autoupdate is not None:
-            payload["wordpress_autoupdate"] = wordpress_autoupdate
-        if plugin_autoupdate is not None:
-            payload["plugin_autoupdate"] = plugin_autoupdate
-        if theme_autoupdate is not None:
-            payload["theme_autoupdate"] = theme_autoupdate
+        # Blank strings mean "leave unchanged"; False is a real toggle value
+        payload = {key: value for key, value in (("name", name), ("php_version", php_version)) if value}
+        toggles = (
+            ("wordpress_autoupdate", wordpress_autoupdate),
+            ("plugin_autoupdate", plugin_autoupdate),
+            ("theme_autoupdate", theme_autoupdate),
+        )
+        payload.update((key, value) for key, value in toggles if value is not None)
 
         if not payload:
             return format_warning("No updates provided")
@@ -223,6 +259,7 @@ async def update_site(
             username=username,
             password=password
         )
+        _invalidate_site(site_id)
         # Single site response is in 'result' key
         site = response.get("result", response)
 
@@ -260,23 +297,29 @@ async def delete_site(
                 {"message": "Set confirm=True to delete the site. This action cannot be undone!"}
             )
 
-        # Get site info first for confirmation message
-        site_response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}",
-            username=username,
-            password=password
+        # Look up the name for the confirmation message alongside the delete
+        # rather than before it - the lookup is best-effort, the delete is not
+        site_response, delete_response = await asyncio.gather(
+            make_api_request(
+                method="GET",
+                endpoint=f"/sites/{site_id}",
+                username=username,
+                password=password
+            ),
+            make_api_request(
+                method="DELETE",
+                endpoint=f"/sites/{site_id}",
+                username=username,
+                password=password
+            ),
+            return_exceptions=True
         )
-        site = site_response.get("result", {})
-        site_name = site.get("name", site_id)
+        if isinstance(delete_response, BaseException):
+            raise delete_response
+        _invalidate_site(site_id)
 
-        # Delete the site
-        await make_api_request(
-            method="DELETE",
-            endpoint=f"/sites/{site_id}",
-            username=username,
-            password=password
-        )
+        site = {} if isinstance(site_response, BaseException) else site_response.get("result", {})
+        site_name = site.get("name", site_id)
 
         return format_success(
             f"Site '{site_name}' (ID: {site_id}) has been deleted",
@@ -304,11 +347,14 @@ async def get_site_status(
         Site status including health checks and metrics
     """
     try:
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}/status",
-            username=username,
-            password=password
+        response = await api_cache.get_or_fetch(
+            cache_key(f"/sites/{site_id}/status", credentials=credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=f"/sites/{site_id}/status",
+                username=username,
+                password=password
+            )
         )
 
         # Status data is in 'result' key
@@ -320,14 +366,7 @@ async def get_site_status(
                 "site_id": site_id,
                 "status": status_data.get("status", "unknown"),
                 "health": status_data.get("health", "unknown"),
-                "uptime": status_data.get("uptime"),
-                "response_time": status_data.get("response_time"),
-                "ssl_status": status_data.get("ssl_status"),
-                "last_backup": status_data.get("last_backup"),
-                "disk_usage": status_data.get("disk_usage"),
-                "bandwidth_usage": status_data.get("bandwidth_usage"),
-                "php_version": status_data.get("php_version"),
-                "wordpress_version": status_data.get("wordpress_version"),
+                **pick(status_data, STATUS_FIELDS),
                 "issues": status_data.get("issues", [])
             }
         )
@@ -336,6 +375,64 @@ async def get_site_status(
         return format_error(f"Failed to get site status for {site_id}: {str(e)}")
 
 
+async def get_sites_status_bulk(
+    site_ids: List[str],
+    concurrency: int = 8,
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get the status and health of several sites in one call.
+
+    Args:
+        site_ids: IDs of the sites to check
+        concurrency: Maximum number of status requests in flight at once
+        username: Rocket.net username (optional, uses env var if not provided)
+        password: Rocket.net password (optional, uses env var if not provided)
+
+    Returns:
+        Status for each site that responded, plus any per-site errors
+    """
+    try:
+        site_ids = list(dict.fromkeys(site_ids))
+        if not site_ids:
+            return format_warning("No site IDs provided")
+
+        # One login, bounded fan-out - the API has no multi-site status endpoint
+        responses = await batch_get(
+            [f"/sites/{site_id}/status" for site_id in site_ids],
+            username=username,
+            password=password,
+            concurrency=max(1, concurrency)
+        )
+
+        credentials = credentials_fingerprint(username, password)
+        statuses = []
+        errors = []
+        for site_id, response in zip(site_ids, responses):
+            if isinstance(response, Exception):
+                errors.append({"site_id": site_id, "error": str(response)})
+                continue
+
+            # Later get_site_status calls for these sites can reuse the result
+            api_cache.set(cache_key(f"/sites/{site_id}/status", credentials=credentials), response)
+            status_data = response.get("result", response)
+            statuses.append({
+                "site_id": site_id,
+                "status": status_data.get("status", "unknown"),
+                "health": status_data.get("health", "unknown"),
+                "issues": status_data.get("issues", [])
+            })
+
+        return format_success(
+            f"Retrieved status for {len(statuses)} of {len(site_ids)} sites",
+            {"statuses": statuses, "errors": errors}
+        )
+
+    except Exception as e:
+        return format_error(f"Failed to get site statuses: {str(e)}")
+
+
 async def clone_site(
     source_site_id: str,
     new_name: str,
@@ -366,11 +463,8 @@ async def clone_site(
             "name": new_name,
             "domain": new_domain
         }
-
-        if location:
-            payload["location"] = location
-        if plan:
-            payload["plan"] = plan
+        optional = (("location", location), ("plan", plan))
+        payload.update((key, value) for key, value in optional if value)
 
         response = await make_api_request(
             method="POST",
@@ -379,6 +473,7 @@ async def clone_site(
             username=username,
             password=password
         )
+        _invalidate_site()
         # Single site response is in 'result' key
         site = response.get("result", response)
 
@@ -413,11 +508,14 @@ async def get_site_settings(
         Complete site settings
     """
     try:
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}/settings",
-            username=username,
-            password=password
+        response = await api_cache.get_or_fetch(
+            cache_key(f"/sites/{site_id}/settings", credentials=credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=f"/sites/{site_id}/settings",
+                username=username,
+                password=password
+            )
         )
         # Settings are in 'result' key
         settings = response.get("result", response)
@@ -457,6 +555,7 @@ async def update_site_settings(
             username=username,
             password=password
         )
+        _invalidate_site(site_id)
         # Updated settings are in 'result' key
         updated_settings = response.get("result", response)
 
@@ -2,10 +2,26 @@
 Utility Functions for Rocket.net MCP Servers
 """
 
+import asyncio
 import json
-from typing import Dict, Any, Optional, List, Union
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Union, Tuple, Hashable, Callable, Awaitable, TypedDict
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional - the stdlib json module is used instead
+    orjson = None
+
+
+def to_json(data: Any) -> str:
+    """Serialize a resource payload as compact JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(",", ":"))
+
 
 def format_success(message: str, data: Optional[Any] = None) -> Dict[str, Any]:
     """Format a success response."""
@@ -40,37 +56,193 @@ def format_warning(message: str, data: Optional[Any] = None) -> Dict[str, Any]:
     return response
 
 
+# Exact-type dispatch for format_datetime - API timestamps are nearly always str
+_DATETIME_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: lambda value: value,
+    datetime: datetime.isoformat,
+}
+
+
 def format_datetime(dt: Optional[Union[str, datetime]]) -> Optional[str]:
     """Format datetime to ISO string."""
     if dt is None:
         return None
-    if isinstance(dt, str):
-        return dt
-    return dt.isoformat()
+    formatter = _DATETIME_FORMATTERS.get(type(dt))
+    if formatter is None:
+        # Subclasses and other date-like values
+        return dt if isinstance(dt, str) else dt.isoformat()
+    return formatter(dt)
+
+
+_MISSING = object()
+
+
+def unwrap(response: Dict[str, Any], *keys: str, default: Any = _MISSING) -> Any:
+    """
+    Get the payload from an API response envelope.
+
+    Returns the value of the first of `keys` present in the response, or
+    `default` (the response itself if not given) when none of them are.
+    Unlike nested .get() fallbacks, later keys are only probed if needed.
+    """
+    for key in keys:
+        if key in response:
+            return response[key]
+    return response if default is _MISSING else default
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    # Each unit is 2**10 times the last, so the bit length picks the unit directly
+    exponent = (int(size_bytes).bit_length() - 1) // 10 if size_bytes >= 1024 else 0
+    exponent = min(exponent, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exponent)):.2f} {_SIZE_UNITS[exponent]}"
+
 
+def pick(data: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Copy the given keys out of a dict in one pass (missing keys become None)."""
+    get = data.get
+    return {key: get(key) for key in keys}
 
-def format_site_info(site: Dict[str, Any]) -> Dict[str, Any]:
+
+class SiteInfo(TypedDict):
+    """Site summary returned by format_site_info."""
+    id: Any
+    name: Optional[str]
+    domain: Optional[str]
+    status: str
+    plan: Optional[str]
+    location: Optional[str]
+    created_at: Optional[str]
+    wordpress_version: Optional[str]
+    php_version: Optional[str]
+    ssl_enabled: bool
+    backups_enabled: bool
+    cdn_enabled: bool
+
+
+def format_site_info(site: Dict[str, Any]) -> SiteInfo:
     """Format site information for consistent output."""
+    # Called once per site when listing, so bind .get once and only look up
+    # the alternate field names when the primary one is missing
+    get = site.get
     return {
-        "id": site.get("id"),
-        "name": site.get("name"),
-        "domain": site.get("domain", site.get("primary_domain")),
-        "status": site.get("status", "unknown"),
-        "plan": site.get("plan", site.get("hosting_plan")),
-        "location": site.get("location", site.get("datacenter")),
-        "created_at": format_datetime(site.get("created_at")),
-        "wordpress_version": site.get("wordpress_version"),
-        "php_version": site.get("php_version"),
-        "ssl_enabled": site.get("ssl_enabled", True),
-        "backups_enabled": site.get("backups_enabled", True),
-        "cdn_enabled": site.get("cdn_enabled", True)
-    }
\ No newline at end of file
+        "id": get("id"),
+        "name": get("name"),
+        "domain": site["domain"] if "domain" in site else get("primary_domain"),
+        "status": get("status", "unknown"),
+        "plan": site["plan"] if "plan" in site else get("hosting_plan"),
+        "location": site["location"] if "location" in site else get("datacenter"),
+        "created_at": format_datetime(get("created_at")),
+        "wordpress_version": get("wordpress_version"),
+        "php_version": get("php_version"),
+        "ssl_enabled": get("ssl_enabled", True),
+        "backups_enabled": get("backups_enabled", True),
+        "cdn_enabled": get("cdn_enabled", True)
+    }
+
+
+class AsyncTTLCache:
+    """
+    Small in-memory cache for read-mostly API results.
+
+    Keys are tuples whose first element is the API endpoint (see cache_key).
+    Entries expire after a per-entry TTL, the least recently used entry is
+    evicted once maxsize is reached, and concurrent misses for the same key
+    wait on a shared lock so only one of them hits the API.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value; a TTL of zero or less disables caching."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Get a cached value, calling fetch() to fill it on a miss.
+
+        Exceptions from fetch() propagate and are never cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                value = self.get(key)
+                if value is None:
+                    value = await fetch()
+                    self.set(key, value, ttl)
+                return value
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+
+    def invalidate(self, endpoint: str, nested: bool = True) -> None:
+        """
+        Drop cached entries for an endpoint.
+
+        With nested=True (the default) everything beneath it goes too, so
+        invalidating "/sites/123" also drops "/sites/123/settings".
+        """
+        prefix = endpoint.rstrip("/") + "/"
+        for key in [
+            k for k in self._entries
+            if k[0] == endpoint or (nested and k[0].startswith(prefix))
+        ]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+def cache_key(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    credentials: Optional[str] = None
+) -> Tuple[Any, ...]:
+    """
+    Build a cache key for an API read, scoped to the caller's credentials.
+
+    credentials is auth.credentials_fingerprint() for the caller's username
+    and password, so a wrong password never hits another caller's entry.
+    """
+    return (endpoint, tuple(sorted(params.items())) if params else (), credentials)
+
+
+# Shared cache for API reads (ROCKETNET_CACHE_TTL seconds by default)
+api_cache = AsyncTTLCache(ttl=float(os.getenv("ROCKETNET_CACHE_TTL", "30")))
@@ -3,10 +3,99 @@ Authentication module for Rocket.net API
 Handles login and token management
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import json
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 import httpx
 
+from utils import gather_bounded
+
+try:
+    import orjson
+except ImportError:  # Optional - the stdlib json module is used instead
+    orjson = None
+
+
+def _decode_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _encode_json(data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """Encode a JSON request body, with orjson when it is installed."""
+    if data is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+# Shared HTTP client - keeps connections to the API alive between tool calls
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+CLIENT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Multiplex concurrent requests over one connection where the API supports
+# it; httpx needs the optional h2 package (httpx[http2]) for this
+CLIENT_HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Reusing one client lets requests ride on pooled keep-alive connections
+    instead of paying a fresh TCP/TLS handshake per call. Must be called
+    from inside a running event loop.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(timeout=CLIENT_TIMEOUT, limits=CLIENT_LIMITS, http2=CLIENT_HTTP2)
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (called on server shutdown)."""
+    global _client, _client_loop
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        _client_loop = None
+
+
+def resolve_credentials(
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> Tuple[Optional[str], Optional[str]]:
+    """The username and password a request will log in with, after the env fallback."""
+    final_username = username or os.getenv("ROCKETNET_USERNAME") or os.getenv("ROCKETNET_EMAIL")
+    final_password = password or os.getenv("ROCKETNET_PASSWORD")
+    return final_username, final_password
+
+
+def credentials_fingerprint(
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> str:
+    """
+    Identify the credentials a request will log in with, for cache keys.
+
+    Covers the password as well as the username, so a cached read is only
+    served to a caller presenting the same credentials that fetched it.
+    """
+    final_username, final_password = resolve_credentials(username, password)
+    return hashlib.sha256(f"{final_username or ''}\0{final_password or ''}".encode()).hexdigest()
+
 
 async def login_to_rocketnet(
     username: Optional[str] = None,
@@ -25,8 +114,7 @@ async def login_to_rocketnet(
         Authentication token
     """
     # Get credentials from params or environment
-    final_username = username or os.getenv("ROCKETNET_USERNAME") or os.getenv("ROCKETNET_EMAIL")
-    final_password = password or os.getenv("ROCKETNET_PASSWORD")
+    final_username, final_password = resolve_credentials(username, password)
 
     if not final_username or not final_password:
         raise ValueError(
@@ -34,23 +122,45 @@ async def login_to_rocketnet(
             "or set ROCKETNET_EMAIL/ROCKETNET_USERNAME and ROCKETNET_PASSWORD environment variables."
         )
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{api_base}/login",
-            json={
-                "username": final_username,
-                "password": final_password
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
+    response = await get_client().post(
+        f"{api_base}/login",
+        json={
+            "username": final_username,
+            "password": final_password
+        }
+    )
+    response.raise_for_status()
+    data = _decode_json(response)
+
+    # Extract token from response
+    token = data.get("token") or data.get("access_token")
+    if not token:
+        raise ValueError("No token received from Rocket.net API")
 
-        # Extract token from response
-        token = data.get("token") or data.get("access_token")
-        if not token:
-            raise ValueError("No token received from Rocket.net API")
+    return token
 
-        return token
+
+async def get_auth_headers(
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    api_base: str = "https://api.rocket.net/v1"
+) -> Dict[str, str]:
+    """
+    Log in and build the headers for authenticated requests.
+
+    Args:
+        username: Optional username for authentication
+        password: Optional password for authentication
+        api_base: API base URL
+
+    Returns:
+        Request headers carrying a fresh bearer token
+    """
+    token = await login_to_rocketnet(username, password, api_base)
+    return {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    }
 
 
 async def make_api_request(
@@ -78,26 +188,76 @@ async def make_api_request(
         API response as dictionary
     """
     # Get token (fresh for each request)
-    token = await login_to_rocketnet(username, password, api_base)
+    headers = await get_auth_headers(username, password, api_base)
 
     # Make the API request
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
+    return await send_with_headers(method, endpoint, headers, json_data, params, api_base)
 
-        # Build full URL
-        url = f"{api_base}{endpoint}" if endpoint.startswith("/") else f"{api_base}/{endpoint}"
 
-        response = await client.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json_data,
-            params=params,
-            timeout=30.0
-        )
+async def batch_requests(
+    requests: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+    headers: Dict[str, str],
+    concurrency: int = 5,
+    api_base: str = "https://api.rocket.net/v1"
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Send several requests with the same auth headers.
+
+    Args:
+        requests: (method, endpoint, json_data) for each request
+        headers: Auth headers from get_auth_headers
+        concurrency: Maximum number of requests in flight at once
+        api_base: API base URL
+
+    Returns:
+        Response data for each request, in order. A request that failed is
+        returned as its exception instead of being raised.
+    """
+    return await gather_bounded(
+        [
+            send_with_headers(method, endpoint, headers, json_data, api_base=api_base)
+            for method, endpoint, json_data in requests
+        ],
+        limit=concurrency
+    )
+
+
+async def send_with_headers(
+    method: str,
+    endpoint: str,
+    headers: Dict[str, str],
+    json_data: Optional[Dict[str, Any]] = None,
+    params: Optional[Dict[str, Any]] = None,
+    api_base: str = "https://api.rocket.net/v1"
+) -> Dict[str, Any]:
+    """
+    Send a request with ready-made auth headers and decode the response.
+
+    Lets a caller that already logged in with get_auth_headers send several
+    requests on one token, in whatever order it needs.
+
+    Args:
+        method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+        endpoint: API endpoint (e.g., "/sites")
+        headers: Auth headers from get_auth_headers
+        json_data: Optional JSON data for request body
+        params: Optional query parameters
+        api_base: API base URL
+
+    Returns:
+        API response as dictionary
+    """
+    # Build full URL
+    url = f"{api_base}{endpoint}" if endpoint.startswith("/") else f"{api_base}/{endpoint}"
+
+    response = await get_client().request(
+        method=method,
+        url=url,
+        headers=headers,
+        # The auth headers already declare a JSON content type
+        content=_encode_json(json_data),
+        params=params
+    )
 
-        response.raise_for_status()
-        return response.json()
\ No newline at end of file
+    response.raise_for_status()
+    return _decode_json(response)
@@ -4,12 +4,22 @@ Rocket.net WordPress Management MCP Server
 WordPress-specific operations for plugins, themes, and WP-CLI.
 """
 
+import asyncio
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Tuple
 
 from fastmcp import FastMCP
-from utils import format_success, format_error
+
+# Make src/ importable once, so the tool modules don't each patch sys.path
+SRC_DIR = str(Path(__file__).parent)
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from auth import make_api_request, close_client, credentials_fingerprint
+from utils import format_success, format_error, api_cache, to_json, unwrap
 
 # Import tools
 from tools.wordpress import (
@@ -20,17 +30,30 @@ from tools.wordpress import (
     deactivate_plugin,
     delete_plugin,
     search_plugins,
+    bulk_plugin_operations,
     list_themes,
     install_theme,
     activate_theme,
     delete_theme,
     search_themes,
     update_themes,
+    bulk_theme_operations,
     get_wordpress_status,
     get_wordpress_login_url,
     run_wpcli_command,
+    run_wpcli_batch,
 )
 
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release the shared API client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
 # Initialize FastMCP server - MUST be at module level for FastMCP Cloud
 mcp = FastMCP(
     name="rocketnet-wordpress",
@@ -45,15 +68,18 @@ mcp = FastMCP(
     - deactivate_plugin: Deactivate a plugin
     - delete_plugin: Remove a plugin
     - search_plugins: Search WordPress.org for plugins
+    - bulk_plugin_operations: Install/update/activate/deactivate/delete many plugins at once
     - list_themes: List all installed themes
     - install_theme: Install a theme from WordPress.org
     - update_themes: Update themes to latest versions
     - activate_theme: Activate an installed theme
     - delete_theme: Remove a theme
     - search_themes: Search WordPress.org for themes
+    - bulk_theme_operations: Install/update/activate/deactivate/delete many themes at once
     - get_wordpress_status: Get WordPress installation health
     - get_wordpress_login_url: Generate SSO login URL
     - run_wpcli_command: Execute WP-CLI commands
+    - run_wpcli_batch: Execute several WP-CLI commands in order with one login
 
     WordPress Features:
     - Plugin management (install, update, activate, delete, search)
@@ -68,7 +94,8 @@ mcp = FastMCP(
 
     All operations require proper authentication via environment variables:
     ROCKETNET_USERNAME and ROCKETNET_PASSWORD
-    """
+    """,
+    lifespan=lifespan
 )
 
 # Register tools
@@ -79,88 +106,153 @@ mcp.tool(activate_plugin)
 mcp.tool(deactivate_plugin)
 mcp.tool(delete_plugin)
 mcp.tool(search_plugins)
+mcp.tool(bulk_plugin_operations)
 mcp.tool(list_themes)
 mcp.tool(install_theme)
 mcp.tool(activate_theme)
 mcp.tool(delete_theme)
 mcp.tool(search_themes)
 mcp.tool(update_themes)
+mcp.tool(bulk_theme_operations)
 mcp.tool(get_wordpress_status)
 mcp.tool(get_wordpress_login_url)
 mcp.tool(run_wpcli_command)
+mcp.tool(run_wpcli_batch)
+
+
+class _PartialResource(Exception):
+    """A resource payload that reports a failed section, so it isn't cached."""
+
+    def __init__(self, payload: Dict[str, Any]):
+        super().__init__("Resource built with errors")
+        self.payload = payload
+
+
+async def _cached_json(key: Tuple[Any, ...], build: Callable[[], Awaitable[Dict[str, Any]]]) -> str:
+    """
+    Return a resource's JSON from the shared cache, rebuilding it once the TTL expires.
+
+    key starts with the endpoint it is read from, so the tools' writes
+    invalidate it along with their own cached reads.
+    """
+    async def _render() -> str:
+        return to_json(await build())
+
+    try:
+        # Resources log in with the env credentials - key on them, so a
+        # change of account never serves the previous account's data
+        return await api_cache.get_or_fetch((*key, credentials_fingerprint()), _render)
+    except _PartialResource as e:
+        return to_json(e.payload)
+
 
 # Register resources
 @mcp.resource("wordpress://{site_id}/status")
 async def wordpress_status_resource(site_id: str) -> str:
     """Get complete WordPress status for a site."""
     try:
-        from auth import make_api_request
-        import json
-
-        # Get WordPress status
-        status_response = await make_api_request("GET", f"/sites/{site_id}/wp/status")
-
-        # Get plugin info
-        plugins_response = await make_api_request("GET", f"/sites/{site_id}/plugins")
-
-        # Get theme info
-        themes_response = await make_api_request("GET", f"/sites/{site_id}/themes")
-
-        status = {
-            "site_id": site_id,
-            "wordpress": status_response.get("status", status_response.get("data", {})),
-            "plugins_summary": {
-                "total": len(plugins_response.get("plugins", [])),
-                "active": sum(1 for p in plugins_response.get("plugins", []) if p.get("status") == "active"),
-                "updates_available": sum(1 for p in plugins_response.get("plugins", []) if p.get("update_available"))
-            },
-            "themes_summary": {
-                "total": len(themes_response.get("themes", [])),
-                "active": next((t.get("name") for t in themes_response.get("themes", []) if t.get("active")), None)
-            }
+        return await _cached_json(
+            (f"/sites/{site_id}/wp/status", "resource"),
+            lambda: _build_wordpress_status(site_id)
+        )
+    except Exception as e:
+        return to_json({"error": str(e)})
+
+
+async def _build_wordpress_status(site_id: str) -> Dict[str, Any]:
+    """Collect WordPress, plugin and theme status for the status resource."""
+    # Fetch status, plugins and themes concurrently; a failed section is
+    # reported in place rather than failing the whole resource
+    status_response, plugins_response, themes_response = await asyncio.gather(
+        make_api_request("GET", f"/sites/{site_id}/wp/status"),
+        make_api_request("GET", f"/sites/{site_id}/plugins"),
+        make_api_request("GET", f"/sites/{site_id}/themes"),
+        return_exceptions=True
+    )
+
+    status = {"site_id": site_id}
+
+    if isinstance(status_response, Exception):
+        status["wordpress"] = {"error": str(status_response)}
+    else:
+        status["wordpress"] = unwrap(status_response, "status", "data", default={})
+
+    if isinstance(plugins_response, Exception):
+        status["plugins_summary"] = {"error": str(plugins_response)}
+    else:
+        plugins = plugins_response.get("plugins", [])
+        active = updates = 0
+        for p in plugins:
+            if p.get("status") == "active":
+                active += 1
+            if p.get("update_available"):
+                updates += 1
+        status["plugins_summary"] = {
+            "total": len(plugins),
+            "active": active,
+            "updates_available": updates
         }
 
-        return json.dumps(status, indent=2)
-    except Exception as e:
-        import json
-        return json.dumps({"error": str(e)}, indent=2)
+    if isinstance(themes_response, Exception):
+        status["themes_summary"] = {"error": str(themes_response)}
+    else:
+        themes = themes_response.get("themes", [])
+        status["themes_summary"] = {
+            "total": len(themes),
+            "active": next((t.get("name") for t in themes if t.get("active")), None)
+        }
+
+    if any(isinstance(r, Exception) for r in (status_response, plugins_response, themes_response)):
+        raise _PartialResource(status)
+    return status
 
 @mcp.resource("plugins://{site_id}/updates")
 async def plugin_updates_resource(site_id: str) -> str:
     """Get plugins needing updates for a site."""
     try:
-        from auth import make_api_request
-        import json
-
-        response = await make_api_request("GET", f"/sites/{site_id}/plugins")
-        plugins = response.get("plugins", response.get("data", []))
-
-        updates_needed = [
-            {
-                "name": p.get("name"),
-                "slug": p.get("slug"),
-                "current_version": p.get("version"),
-                "latest_version": p.get("latest_version")
-            }
-            for p in plugins if p.get("update_available")
-        ]
-
-        return json.dumps({
-            "site_id": site_id,
-            "updates_needed": updates_needed,
-            "count": len(updates_needed)
-        }, indent=2)
+        return await _cached_json(
+            (f"/sites/{site_id}/plugins", "updates"),
+            lambda: _build_plugin_updates(site_id)
+        )
     except Exception as e:
-        import json
-        return json.dumps({"error": str(e)}, indent=2)
+        return to_json({"error": str(e)})
+
+
+async def _build_plugin_updates(site_id: str) -> Dict[str, Any]:
+    """Collect the plugins with updates available for the updates resource."""
+    response = await make_api_request("GET", f"/sites/{site_id}/plugins")
+    plugins = unwrap(response, "plugins", "data", default=[])
+
+    updates_needed = [
+        {
+            "name": p.get("name"),
+            "slug": p.get("slug"),
+            "current_version": p.get("version"),
+            "latest_version": p.get("latest_version")
+        }
+        for p in plugins if p.get("update_available")
+    ]
+
+    return {
+        "site_id": site_id,
+        "updates_needed": updates_needed,
+        "count": len(updates_needed)
+    }
 
 # Optional: Local testing
 if __name__ == "__main__":
-    import asyncio
     import logging
     from dotenv import load_dotenv
 
     logging.basicConfig(level=logging.INFO)
     load_dotenv()
 
+    # uvloop is optional (not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    logging.info(f"Event loop policy: {type(asyncio.get_event_loop_policy()).__name__}")
+
     asyncio.run(mcp.run())
\ No newline at end of file
@@ -2,15 +2,85 @@
 WordPress Management Tools for Rocket.net
 """
 
-import sys
-from pathlib import Path
-from typing import Optional, Dict, Any, List
+import logging
+import os
+from typing import Optional, Dict, Any, List, Tuple, Hashable, Callable, Awaitable
 
-# Add parent directory to path for local imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import httpx
 
-from auth import make_api_request
-from utils import format_success, format_error, format_warning
+from auth import make_api_request, get_auth_headers, batch_requests, credentials_fingerprint, send_with_headers
+from utils import (
+    format_success,
+    format_error,
+    format_warning,
+    api_cache,
+    cache_key,
+    is_valid_slug,
+    unwrap,
+    PluginInfo,
+    ThemeInfo,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bulk operation actions, in the order they are applied
+BULK_ACTIONS = ("install", "update", "activate", "deactivate", "delete")
+
+# Statuses returned when the API won't take a list of slugs in one update
+# (not 404 - that means the site itself doesn't exist)
+UNSUPPORTED_LIST_UPDATE = (400, 405, 422)
+
+# WordPress.org search results change over hours, not seconds - keep them
+# much longer than site reads (ROCKETNET_SEARCH_CACHE_TTL seconds)
+SEARCH_CACHE_TTL = float(os.getenv("ROCKETNET_SEARCH_CACHE_TTL", "3600"))
+
+
+def _invalidate_site(site_id: str, kind: str) -> None:
+    """Drop cached installed plugins/themes and status for a site after a write."""
+    # Searches live under the same path but don't depend on what is installed
+    api_cache.invalidate(f"/sites/{site_id}/{kind}s", nested=False)
+    api_cache.invalidate(f"/sites/{site_id}/wp/status")
+
+
+def _is_unavailable(status_code: int) -> bool:
+    """Whether a status means the API is temporarily unable to answer."""
+    return status_code == 429 or status_code >= 500
+
+
+async def _cached_read(
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Dict[str, Any]]],
+    ttl: Optional[float] = None
+) -> Tuple[Dict[str, Any], Optional[float]]:
+    """
+    Read through the API cache, falling back to an expired entry if the API is unavailable.
+
+    Only connection failures, 429s and 5xx responses fall back; anything
+    else (bad credentials, a deleted site) is raised as usual. Returns the
+    response and, when it came from the stale fallback, its age in seconds
+    (None for a fresh response). Raises if there is nothing to fall back to.
+    """
+    try:
+        return await api_cache.get_or_fetch(key, fetch, ttl), None
+    except (httpx.TransportError, httpx.HTTPStatusError) as e:
+        if isinstance(e, httpx.HTTPStatusError) and not _is_unavailable(e.response.status_code):
+            raise
+        stale = api_cache.get_stale(key)
+        if stale is None:
+            raise
+        response, age = stale
+        logger.debug(f"Serving {key[0]} from stale cache ({age:.0f}s old): {e}")
+        return response, age
+
+
+def _cached_result(message: str, data: Dict[str, Any], staleness: Optional[float]) -> Dict[str, Any]:
+    """Format a read result, flagged as a warning when served from stale cache."""
+    if staleness is None:
+        return format_success(message, data)
+    return format_warning(
+        f"{message} (served from stale cache)",
+        {**data, "stale": True, "staleness_seconds": round(staleness, 1)}
+    )
 
 
 async def list_plugins(
@@ -36,37 +106,51 @@ async def list_plugins(
         if status:
             params["status"] = status
 
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}/plugins",
-            params=params,
-            username=username,
-            password=password
+        endpoint = f"/sites/{site_id}/plugins"
+        response, staleness = await _cached_read(
+            cache_key(endpoint, params, credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=endpoint,
+                params=params,
+                username=username,
+                password=password
+            )
         )
         # API returns data in 'result' key
-        plugins = response.get("result", [])
+        plugins = unwrap(response, "result", default=[])
 
-        formatted_plugins = []
+        # Format and count in a single pass over the plugins
+        formatted_plugins: List[PluginInfo] = []
+        active_count = updates_available = 0
         for plugin in plugins:
+            get = plugin.get
+            plugin_status = get("status", "inactive")
+            update_available = get("update_available", False)
             formatted_plugins.append({
-                "name": plugin.get("name"),
-                "slug": plugin.get("slug"),
-                "version": plugin.get("version"),
-                "status": plugin.get("status", "inactive"),
-                "update_available": plugin.get("update_available", False),
-                "latest_version": plugin.get("latest_version"),
-                "author": plugin.get("author"),
-                "description": plugin.get("description")
+                "name": get("name"),
+                "slug": get("slug"),
+                "version": get("version"),
+                "status": plugin_status,
+                "update_available": update_available,
+                "latest_version": get("latest_version"),
+                "author": get("author"),
+                "description": get("description")
             })
+            if plugin_status == "active":
+                active_count += 1
+            if update_available:
+                updates_available += 1
 
-        return format_success(
+        return _cached_result(
             f"Found {len(formatted_plugins)} plugins for site {site_id}",
             {
                 "plugins": formatted_plugins,
                 "count": len(formatted_plugins),
-                "active_count": sum(1 for p in formatted_plugins if p["status"] == "active"),
-                "updates_available": sum(1 for p in formatted_plugins if p["update_available"])
-            }
+                "active_count": active_count,
+                "updates_available": updates_available
+            },
+            staleness
         )
 
     except Exception as e:
@@ -94,6 +178,9 @@ async def install_plugin(
         Information about the installed plugin
     """
     try:
+        if not is_valid_slug(plugin_slug):
+            return format_error(f"Invalid plugin slug: {plugin_slug!r}")
+
         payload = {
             "slug": plugin_slug,
             "activate": activate
@@ -107,7 +194,9 @@ async def install_plugin(
             password=password
         )
         # Single plugin response is in 'result' key
-        plugin = response.get("result", response)
+        plugin = unwrap(response, "result")
+
+        _invalidate_site(site_id, "plugin")
 
         return format_success(
             f"Plugin {plugin_slug} installed successfully",
@@ -124,6 +213,51 @@ async def install_plugin(
         return format_error(f"Failed to install plugin {plugin_slug}: {str(e)}")
 
 
+async def _update_each(
+    site_id: str,
+    kind: str,
+    slugs: List[str],
+    username: Optional[str],
+    password: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Update plugins or themes one slug at a time, sending the requests concurrently.
+
+    Used when the API rejects a list of slugs in a single update; latency is
+    then bounded by the slowest update rather than the sum of all of them.
+    """
+    endpoint = f"/sites/{site_id}/{kind}s"
+    headers = await get_auth_headers(username, password)
+    responses = await batch_requests(
+        [("PUT", endpoint, {kind: slug}) for slug in slugs],
+        headers,
+        concurrency=10
+    )
+
+    updated = []
+    failed = []
+    for slug, response in zip(slugs, responses):
+        if isinstance(response, Exception):
+            failed.append({"slug": slug, "error": str(response)})
+        else:
+            updated.append(slug)
+
+    _invalidate_site(site_id, kind)
+
+    data = {
+        "site_id": site_id,
+        f"updated_{kind}s": updated,
+        "updated_count": len(updated),
+        "failed_updates": failed,
+        "message": f"{kind.capitalize()} updates completed"
+    }
+    if not updated:
+        return format_error(f"Failed to update {kind}s: {failed[0]['error']}", data)
+    if failed:
+        return format_warning(f"{len(failed)} of {len(slugs)} {kind} updates failed", data)
+    return format_success(f"{kind.capitalize()}s updated successfully", data)
+
+
 async def update_plugins(
     site_id: str,
     plugin_slugs: Optional[List[str]] = None,
@@ -150,19 +284,30 @@ async def update_plugins(
         if update_all:
             payload["update_all"] = True
         elif plugin_slugs:
+            invalid = [slug for slug in plugin_slugs if not is_valid_slug(slug)]
+            if invalid:
+                return format_error(f"Invalid plugin slugs: {invalid}")
             payload["plugins"] = plugin_slugs
         else:
             return format_warning("Specify plugin_slugs or set update_all=True")
 
-        response = await make_api_request(
-            method="PUT",
-            endpoint=f"/sites/{site_id}/plugins",
-            json_data=payload,
-            username=username,
-            password=password
-        )
+        try:
+            response = await make_api_request(
+                method="PUT",
+                endpoint=f"/sites/{site_id}/plugins",
+                json_data=payload,
+                username=username,
+                password=password
+            )
+        except httpx.HTTPStatusError as e:
+            if update_all or e.response.status_code not in UNSUPPORTED_LIST_UPDATE:
+                raise
+            # Fall back to one update per plugin
+            return await _update_each(site_id, "plugin", plugin_slugs, username, password)
         # Response is in 'result' key
-        result = response.get("result", response)
+        result = unwrap(response, "result")
+
+        _invalidate_site(site_id, "plugin")
 
         return format_success(
             "Plugins updated successfully",
@@ -198,6 +343,9 @@ async def activate_plugin(
         Confirmation of plugin activation
     """
     try:
+        if not is_valid_slug(plugin_slug):
+            return format_error(f"Invalid plugin slug: {plugin_slug!r}")
+
         payload = {
             "slug": plugin_slug,
             "action": "activate"
@@ -211,6 +359,8 @@ async def activate_plugin(
             password=password
         )
 
+        _invalidate_site(site_id, "plugin")
+
         return format_success(
             f"Plugin {plugin_slug} activated",
             {
@@ -243,6 +393,9 @@ async def deactivate_plugin(
         Confirmation of plugin deactivation
     """
     try:
+        if not is_valid_slug(plugin_slug):
+            return format_error(f"Invalid plugin slug: {plugin_slug!r}")
+
         payload = {
             "slug": plugin_slug,
             "action": "deactivate"
@@ -256,6 +409,8 @@ async def deactivate_plugin(
             password=password
         )
 
+        _invalidate_site(site_id, "plugin")
+
         return format_success(
             f"Plugin {plugin_slug} deactivated",
             {
@@ -288,6 +443,9 @@ async def delete_plugin(
         Confirmation of plugin deletion
     """
     try:
+        if not is_valid_slug(plugin_slug):
+            return format_error(f"Invalid plugin slug: {plugin_slug!r}")
+
         params = {"slug": plugin_slug}
 
         await make_api_request(
@@ -298,6 +456,8 @@ async def delete_plugin(
             password=password
         )
 
+        _invalidate_site(site_id, "plugin")
+
         return format_success(
             f"Plugin {plugin_slug} deleted",
             {
@@ -336,27 +496,33 @@ async def search_plugins(
             "limit": limit
         }
 
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}/plugins/search",
-            params=params,
-            username=username,
-            password=password
+        endpoint = f"/sites/{site_id}/plugins/search"
+        response = await api_cache.get_or_fetch(
+            cache_key(endpoint, params, credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=endpoint,
+                params=params,
+                username=username,
+                password=password
+            ),
+            ttl=SEARCH_CACHE_TTL
         )
         # API returns data in 'result' key
-        plugins = response.get("result", [])
+        plugins = unwrap(response, "result", default=[])
 
         formatted_results = []
         for plugin in plugins[:limit]:
+            get = plugin.get
             formatted_results.append({
-                "name": plugin.get("name"),
-                "slug": plugin.get("slug"),
-                "rating": plugin.get("rating"),
-                "num_ratings": plugin.get("num_ratings"),
-                "active_installs": plugin.get("active_installs"),
-                "last_updated": plugin.get("last_updated"),
-                "tested_up_to": plugin.get("tested_up_to"),
-                "short_description": plugin.get("short_description")
+                "name": get("name"),
+                "slug": get("slug"),
+                "rating": get("rating"),
+                "num_ratings": get("num_ratings"),
+                "active_installs": get("active_installs"),
+                "last_updated": get("last_updated"),
+                "tested_up_to": get("tested_up_to"),
+                "short_description": get("short_description")
             })
 
         return format_success(
@@ -372,6 +538,105 @@ async def search_plugins(
         return format_error(f"Failed to search plugins: {str(e)}")
 
 
+async def _bulk_operations(
+    site_id: str,
+    kind: str,
+    operations: List[Dict[str, str]],
+    username: Optional[str],
+    password: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Apply plugin or theme operations with one login and as few requests as possible.
+
+    Installs and deletes for every slug go out as a single request each (the
+    API takes a comma-separated list); updates and (de)activations are
+    per-slug requests sent concurrently. Actions are applied in BULK_ACTIONS
+    order, so a slug can be installed and activated in one call.
+    """
+    slugs_by_action: Dict[str, List[str]] = {action: [] for action in BULK_ACTIONS}
+    for operation in operations:
+        action = operation.get("action")
+        slug = operation.get("slug")
+        if action not in slugs_by_action or not is_valid_slug(slug):
+            return format_error(
+                f"Invalid {kind} operation: {operation}",
+                {"allowed_actions": list(BULK_ACTIONS)}
+            )
+        if slug not in slugs_by_action[action]:
+            slugs_by_action[action].append(slug)
+
+    if not any(slugs_by_action.values()):
+        return format_warning(f"No {kind} operations provided")
+
+    endpoint = f"/sites/{site_id}/{kind}s"
+    headers = await get_auth_headers(username, password)
+
+    results = []
+    for action, slugs in slugs_by_action.items():
+        if not slugs:
+            continue
+
+        if action == "install":
+            requests = [("POST", endpoint, {f"{kind}s": ",".join(slugs), "activate": False})]
+            groups = [slugs]
+        elif action == "delete":
+            requests = [("DELETE", endpoint, {f"{kind}s": ",".join(slugs)})]
+            groups = [slugs]
+        elif action == "update":
+            requests = [("PUT", endpoint, {kind: slug}) for slug in slugs]
+            groups = [[slug] for slug in slugs]
+        else:
+            requests = [("PATCH", endpoint, {kind: slug, "status": action}) for slug in slugs]
+            groups = [[slug] for slug in slugs]
+
+        responses = await batch_requests(requests, headers)
+        for group, response in zip(groups, responses):
+            error = str(response) if isinstance(response, Exception) else None
+            results.extend(
+                {"slug": slug, "action": action, "success": error is None, "error": error}
+                for slug in group
+            )
+
+    _invalidate_site(site_id, kind)
+
+    failed = sum(1 for result in results if not result["success"])
+    data = {
+        "site_id": site_id,
+        "results": results,
+        "total": len(results),
+        "successful": len(results) - failed,
+        "failed": failed
+    }
+    if failed:
+        return format_warning(f"{failed} of {len(results)} {kind} operations failed", data)
+    return format_success(f"Completed {len(results)} {kind} operations", data)
+
+
+async def bulk_plugin_operations(
+    site_id: str,
+    operations: List[Dict[str, str]],
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Install, update, activate, deactivate or delete several plugins in one call.
+
+    Args:
+        site_id: The ID of the site
+        operations: List of {"slug": ..., "action": ...} where action is one of
+            install, update, activate, deactivate, delete
+        username: Rocket.net username (optional, uses env var if not provided)
+        password: Rocket.net password (optional, uses env var if not provided)
+
+    Returns:
+        Per-plugin results with successful/failed counts
+    """
+    try:
+        return await _bulk_operations(site_id, "plugin", operations, username, password)
+    except Exception as e:
+        return format_error(f"Failed to run plugin operations: {str(e)}")
+
+
 async def list_themes(
     site_id: str,
     username: Optional[str] = None,
@@ -389,38 +654,52 @@ async def list_themes(
         List of installed themes
     """
     try:
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}/themes",
-            username=username,
-            password=password
+        endpoint = f"/sites/{site_id}/themes"
+        response, staleness = await _cached_read(
+            cache_key(endpoint, credentials=credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=endpoint,
+                username=username,
+                password=password
+            )
         )
         # API returns themes in 'result' key
-        themes = response.get("result", [])
+        themes = unwrap(response, "result", default=[])
 
-        formatted_themes = []
+        # Format, count updates and find the active theme in a single pass
+        formatted_themes: List[ThemeInfo] = []
+        active_theme = None
+        updates_available = 0
         for theme in themes:
+            get = theme.get
+            name = get("name")
+            active = get("active", False)
+            update_available = get("update_available", False)
             formatted_themes.append({
-                "name": theme.get("name"),
-                "slug": theme.get("slug"),
-                "version": theme.get("version"),
-                "status": theme.get("status", "inactive"),
-                "active": theme.get("active", False),
-                "update_available": theme.get("update_available", False),
-                "author": theme.get("author"),
-                "screenshot": theme.get("screenshot")
+                "name": name,
+                "slug": get("slug"),
+                "version": get("version"),
+                "status": get("status", "inactive"),
+                "active": active,
+                "update_available": update_available,
+                "author": get("author"),
+                "screenshot": get("screenshot")
             })
+            if active and active_theme is None:
+                active_theme = name
+            if update_available:
+                updates_available += 1
 
-        active_theme = next((t for t in formatted_themes if t["active"]), None)
-
-        return format_success(
+        return _cached_result(
             f"Found {len(formatted_themes)} themes for site {site_id}",
             {
                 "themes": formatted_themes,
                 "count": len(formatted_themes),
-                "active_theme": active_theme.get("name") if active_theme else None,
-                "updates_available": sum(1 for t in formatted_themes if t["update_available"])
-            }
+                "active_theme": active_theme,
+                "updates_available": updates_available
+            },
+            staleness
         )
 
     except Exception as e:
@@ -448,6 +727,9 @@ async def install_theme(
         Information about the installed theme
     """
     try:
+        if not is_valid_slug(theme_slug):
+            return format_error(f"Invalid theme slug: {theme_slug!r}")
+
         payload = {
             "slug": theme_slug,
             "activate": activate
@@ -461,7 +743,9 @@ async def install_theme(
             password=password
         )
         # Single theme response is in 'result' key
-        theme = response.get("result", response)
+        theme = unwrap(response, "result")
+
+        _invalidate_site(site_id, "theme")
 
         return format_success(
             f"Theme {theme_slug} installed successfully",
@@ -496,6 +780,9 @@ async def activate_theme(
         Confirmation of theme activation
     """
     try:
+        if not is_valid_slug(theme_slug):
+            return format_error(f"Invalid theme slug: {theme_slug!r}")
+
         payload = {
             "slug": theme_slug,
             "action": "activate"
@@ -509,6 +796,8 @@ async def activate_theme(
             password=password
         )
 
+        _invalidate_site(site_id, "theme")
+
         return format_success(
             f"Theme {theme_slug} activated",
             {
@@ -542,6 +831,9 @@ async def delete_theme(
         Confirmation of theme deletion
     """
     try:
+        if not is_valid_slug(theme_slug):
+            return format_error(f"Invalid theme slug: {theme_slug!r}")
+
         params = {"slug": theme_slug}
 
         await make_api_request(
@@ -552,6 +844,8 @@ async def delete_theme(
             password=password
         )
 
+        _invalidate_site(site_id, "theme")
+
         return format_success(
             f"Theme {theme_slug} deleted",
             {
@@ -590,29 +884,35 @@ async def search_themes(
             "limit": limit
         }
 
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}/themes/search",
-            params=params,
-            username=username,
-            password=password
+        endpoint = f"/sites/{site_id}/themes/search"
+        response = await api_cache.get_or_fetch(
+            cache_key(endpoint, params, credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=endpoint,
+                params=params,
+                username=username,
+                password=password
+            ),
+            ttl=SEARCH_CACHE_TTL
         )
         # API returns themes in 'result' key
-        themes = response.get("result", [])
+        themes = unwrap(response, "result", default=[])
 
         formatted_results = []
         for theme in themes[:limit]:
+            get = theme.get
             formatted_results.append({
-                "name": theme.get("name"),
-                "slug": theme.get("slug"),
-                "rating": theme.get("rating"),
-                "num_ratings": theme.get("num_ratings"),
-                "active_installs": theme.get("active_installs"),
-                "last_updated": theme.get("last_updated"),
-                "tested_up_to": theme.get("tested_up_to"),
-                "short_description": theme.get("description", theme.get("short_description")),
-                "author": theme.get("author"),
-                "screenshot": theme.get("screenshot")
+                "name": get("name"),
+                "slug": get("slug"),
+                "rating": get("rating"),
+                "num_ratings": get("num_ratings"),
+                "active_installs": get("active_installs"),
+                "last_updated": get("last_updated"),
+                "tested_up_to": get("tested_up_to"),
+                "short_description": get("description", get("short_description")),
+                "author": get("author"),
+                "screenshot": get("screenshot")
             })
 
         return format_success(
@@ -654,19 +954,30 @@ async def update_themes(
         if update_all:
             payload["update_all"] = True
         elif theme_slugs:
+            invalid = [slug for slug in theme_slugs if not is_valid_slug(slug)]
+            if invalid:
+                return format_error(f"Invalid theme slugs: {invalid}")
             payload["themes"] = theme_slugs
         else:
             return format_warning("Specify theme_slugs or set update_all=True")
 
-        response = await make_api_request(
-            method="PUT",
-            endpoint=f"/sites/{site_id}/themes",
-            json_data=payload,
-            username=username,
-            password=password
-        )
+        try:
+            response = await make_api_request(
+                method="PUT",
+                endpoint=f"/sites/{site_id}/themes",
+                json_data=payload,
+                username=username,
+                password=password
+            )
+        except httpx.HTTPStatusError as e:
+            if update_all or e.response.status_code not in UNSUPPORTED_LIST_UPDATE:
+                raise
+            # Fall back to one update per theme
+            return await _update_each(site_id, "theme", theme_slugs, username, password)
         # Response is in 'result' key
-        result = response.get("result", response)
+        result = unwrap(response, "result")
+
+        _invalidate_site(site_id, "theme")
 
         return format_success(
             "Themes updated successfully",
@@ -683,6 +994,31 @@ async def update_themes(
         return format_error(f"Failed to update themes: {str(e)}")
 
 
+async def bulk_theme_operations(
+    site_id: str,
+    operations: List[Dict[str, str]],
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Install, update, activate, deactivate or delete several themes in one call.
+
+    Args:
+        site_id: The ID of the site
+        operations: List of {"slug": ..., "action": ...} where action is one of
+            install, update, activate, deactivate, delete
+        username: Rocket.net username (optional, uses env var if not provided)
+        password: Rocket.net password (optional, uses env var if not provided)
+
+    Returns:
+        Per-theme results with successful/failed counts
+    """
+    try:
+        return await _bulk_operations(site_id, "theme", operations, username, password)
+    except Exception as e:
+        return format_error(f"Failed to run theme operations: {str(e)}")
+
+
 async def get_wordpress_status(
     site_id: str,
     username: Optional[str] = None,
@@ -700,16 +1036,20 @@ async def get_wordpress_status(
         WordPress status information
     """
     try:
-        response = await make_api_request(
-            method="GET",
-            endpoint=f"/sites/{site_id}/wp/status",
-            username=username,
-            password=password
+        endpoint = f"/sites/{site_id}/wp/status"
+        response, staleness = await _cached_read(
+            cache_key(endpoint, credentials=credentials_fingerprint(username, password)),
+            lambda: make_api_request(
+                method="GET",
+                endpoint=endpoint,
+                username=username,
+                password=password
+            )
         )
         # Status response is in 'result' key
-        status = response.get("result", response)
+        status = unwrap(response, "result")
 
-        return format_success(
+        return _cached_result(
             "WordPress status retrieved",
             {
                 "site_id": site_id,
@@ -726,7 +1066,8 @@ async def get_wordpress_status(
                 "theme_count": status.get("theme_count"),
                 "last_update_check": status.get("last_update_check"),
                 "auto_updates": status.get("auto_updates", {})
-            }
+            },
+            staleness
         )
 
     except Exception as e:
@@ -757,7 +1098,7 @@ async def get_wordpress_login_url(
             password=password
         )
         # Login info is in 'result' key
-        login_info = response.get("result", response)
+        login_info = unwrap(response, "result")
 
         return format_success(
             "WordPress SSO login URL generated",
@@ -809,7 +1150,10 @@ async def run_wpcli_command(
             password=password
         )
         # Response is in 'result' key
-        result = response.get("result", response)
+        result = unwrap(response, "result")
+
+        # A WP-CLI command can change anything on the site
+        api_cache.invalidate(f"/sites/{site_id}")
 
         return format_success(
             f"WP-CLI command executed: {command}",
@@ -824,4 +1168,89 @@ async def run_wpcli_command(
         )
 
     except Exception as e:
-        return format_error(f"Failed to execute WP-CLI command: {str(e)}")
\ No newline at end of file
+        return format_error(f"Failed to execute WP-CLI command: {str(e)}")
+
+
+async def run_wpcli_batch(
+    site_id: str,
+    commands: List[Dict[str, Any]],
+    username: Optional[str] = None,
+    password: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Execute several WP-CLI commands on the WordPress site with one login.
+
+    Commands run one at a time, in the order given, over the shared
+    connection; a failed command does not stop the ones after it.
+
+    Args:
+        site_id: The ID of the site
+        commands: List of {"command": ..., "args": [...]} (args optional)
+        username: Rocket.net username (optional, uses env var if not provided)
+        password: Rocket.net password (optional, uses env var if not provided)
+
+    Returns:
+        Per-command output and exit codes with successful/failed counts
+    """
+    try:
+        payloads = []
+        for entry in commands:
+            command = entry.get("command") if isinstance(entry, dict) else None
+            if not command or not isinstance(command, str):
+                return format_error(f"Invalid WP-CLI command: {entry}")
+            payload = {"command": command}
+            if entry.get("args"):
+                payload["args"] = entry["args"]
+            payloads.append(payload)
+
+        if not payloads:
+            return format_warning("No WP-CLI commands provided")
+
+        endpoint = f"/sites/{site_id}/wpcli"
+        headers = await get_auth_headers(username, password)
+        responses = []
+        for payload in payloads:
+            try:
+                responses.append(await send_with_headers("POST", endpoint, headers, payload))
+            except Exception as e:
+                responses.append(e)
+
+        # The commands can change anything on the site
+        api_cache.invalidate(f"/sites/{site_id}")
+
+        results = []
+        failed = 0
+        for payload, response in zip(payloads, responses):
+            if isinstance(response, Exception):
+                failed += 1
+                results.append({
+                    "command": payload["command"],
+                    "args": payload.get("args"),
+                    "error": str(response)
+                })
+                continue
+            result = unwrap(response, "result")
+            exit_code = result.get("exit_code", 0)
+            if exit_code != 0:
+                failed += 1
+            results.append({
+                "command": payload["command"],
+                "args": payload.get("args"),
+                "output": result.get("output"),
+                "exit_code": exit_code,
+                "execution_time": result.get("execution_time")
+            })
+
+        data = {
+            "site_id": site_id,
+            "results": results,
+            "total": len(results),
+            "successful": len(results) - failed,
+            "failed": failed
+        }
+        if failed:
+            return format_warning(f"{failed} of {len(results)} WP-CLI commands failed", data)
+        return format_success(f"Executed {len(results)} WP-CLI commands", data)
+
+    except Exception as e:
+        return format_error(f"Failed to execute WP-CLI commands: {str(e)}")
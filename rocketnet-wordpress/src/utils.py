@@ -2,9 +2,46 @@
 Utility functions for formatting responses
 """
 
-from typing import Any, Dict, Optional, List
+import asyncio
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, List, Tuple, TypedDict, TypeVar, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional - the stdlib json module is used instead
+    orjson = None
+
+
+T = TypeVar("T")
+
+
+async def gather_bounded(coros: Iterable[Awaitable[T]], limit: int = 10) -> List[Union[T, BaseException]]:
+    """
+    Await coroutines concurrently, at most `limit` at a time.
+
+    Results come back in order; a coroutine that raised is returned as its
+    exception rather than cancelling the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+
+def to_json(data: Any) -> str:
+    """Serialize a resource payload as indented JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
 
 def format_success(message: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Format a successful response."""
@@ -12,7 +49,7 @@ def format_success(message: str, data: Optional[Dict[str, Any]] = None) -> Dict[
         "success": True,
         "message": message
     }
-    if data:
+    if data is not None:
         response["data"] = data
     return response
 
@@ -23,7 +60,7 @@ def format_error(message: str, details: Optional[Dict[str, Any]] = None) -> Dict
         "success": False,
         "error": message
     }
-    if details:
+    if details is not None:
         response["details"] = details
     return response
 
@@ -34,30 +71,94 @@ def format_warning(message: str, data: Optional[Dict[str, Any]] = None) -> Dict[
         "success": True,
         "warning": message
     }
-    if data:
+    if data is not None:
         response["data"] = data
     return response
 
 
+_MISSING = object()
+
+
+def unwrap(response: Dict[str, Any], *keys: str, default: Any = _MISSING) -> Any:
+    """
+    Get the payload from an API response envelope.
+
+    Returns the value of the first of `keys` present in the response, or
+    `default` (the response itself if not given) when none of them are.
+    Unlike nested .get() fallbacks, later keys are only probed if needed.
+    """
+    for key in keys:
+        if key in response:
+            return response[key]
+    return response if default is _MISSING else default
+
+
+DATETIME_DISPLAY_FORMAT = '%Y-%m-%d %H:%M:%S UTC'
+
+
 def format_datetime(dt_str: Optional[str]) -> Optional[str]:
     """Format datetime string for display."""
     if not dt_str:
         return None
 
     try:
-        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-    except:
+        # Python 3.11+ parses a trailing 'Z' itself
+        dt = datetime.fromisoformat(dt_str)
+    except ValueError:
+        if not dt_str.endswith('Z'):
+            return dt_str
+        try:
+            dt = datetime.fromisoformat(dt_str[:-1] + '+00:00')
+        except ValueError:
+            return dt_str
+    except TypeError:
         return dt_str
+    return dt.strftime(DATETIME_DISPLAY_FORMAT)
+
+
+# Plugin/theme directory names: WordPress.org slugs are lowercase with
+# hyphens, but premium and custom ones may use capitals, dots or underscores
+_SLUG_RE = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,199}")
+
+
+def is_valid_slug(slug: Optional[str]) -> bool:
+    """Check that a plugin or theme slug is well-formed before sending it to the API."""
+    return isinstance(slug, str) and _SLUG_RE.fullmatch(slug) is not None
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_size(size_bytes: int) -> str:
     """Format bytes into human readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    # Each unit is 2**10 times the last, so the bit length picks the unit directly
+    exponent = (int(size_bytes).bit_length() - 1) // 10 if size_bytes >= 1024 else 0
+    exponent = min(exponent, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * exponent)):.2f} {_SIZE_UNITS[exponent]}"
+
+
+class PluginInfo(TypedDict):
+    """Installed plugin summary returned by list_plugins."""
+    name: Optional[str]
+    slug: Optional[str]
+    version: Optional[str]
+    status: str
+    update_available: bool
+    latest_version: Optional[str]
+    author: Optional[str]
+    description: Optional[str]
+
+
+class ThemeInfo(TypedDict):
+    """Installed theme summary returned by list_themes."""
+    name: Optional[str]
+    slug: Optional[str]
+    version: Optional[str]
+    status: str
+    active: bool
+    update_available: bool
+    author: Optional[str]
+    screenshot: Optional[str]
 
 
 def format_list(items: List[Any], key: Optional[str] = None) -> str:
@@ -67,4 +168,136 @@ def format_list(items: List[Any], key: Optional[str] = None) -> str:
 
     if key:
         return ", ".join(str(item.get(key, '')) for item in items)
-    return ", ".join(str(item) for item in items)
\ No newline at end of file
+    return ", ".join(str(item) for item in items)
+
+
+class AsyncTTLCache:
+    """
+    Small in-memory cache for read-mostly API results.
+
+    Keys are tuples whose first element is the API endpoint (see cache_key).
+    Entries expire after a per-entry TTL, the least recently used entry is
+    evicted once maxsize is reached, and concurrent misses for the same key
+    share a single in-flight request ("single-flight"). Expired entries
+    are kept until evicted so get_stale() can serve them if the API is down.
+    """
+
+    def __init__(self, ttl: float = 30.0, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # key -> (stored_at, expires_at, value)
+        self._entries: "OrderedDict[Hashable, Tuple[float, float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a fresh cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        _, expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Get a cached value even if expired, with its age in seconds, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, _, value = entry
+        return value, time.monotonic() - stored_at
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value; a TTL of zero or less disables caching."""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        self._entries[key] = (now, now + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None
+    ) -> Any:
+        """
+        Get a cached value, calling fetch() to fill it on a miss.
+
+        Concurrent misses for the same key await one shared fetch() call,
+        even when caching is disabled. Exceptions from fetch() propagate to
+        every waiter and are never cached.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                # Shielded so a waiter giving up doesn't cancel the shared fetch
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The caller running the fetch was cancelled - fetch ourselves
+                return await self.get_or_fetch(key, fetch, ttl)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark it retrieved so there is no warning when nobody was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        self.set(key, value, ttl)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, endpoint: str, nested: bool = True) -> None:
+        """
+        Drop cached entries for an endpoint.
+
+        With nested=True (the default) everything beneath it goes too, so
+        invalidating "/sites/123" also drops "/sites/123/settings".
+        """
+        prefix = endpoint.rstrip("/") + "/"
+        for key in [
+            k for k in self._entries
+            if k[0] == endpoint or (nested and k[0].startswith(prefix))
+        ]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+def cache_key(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    credentials: Optional[str] = None
+) -> Tuple[Any, ...]:
+    """
+    Build a cache key for an API read, scoped to the caller's credentials.
+
+    credentials is auth.credentials_fingerprint() for the caller's username
+    and password, so a wrong password never hits another caller's entry.
+    """
+    return (endpoint, tuple(sorted(params.items())) if params else (), credentials)
+
+
+# Shared cache for API reads (ROCKETNET_CACHE_TTL seconds by default)
+api_cache = AsyncTTLCache(ttl=float(os.getenv("ROCKETNET_CACHE_TTL", "10")))
@@ -7,283 +7,570 @@ This helps identify which endpoints return arrays vs objects.
 import os
 import sys
 import json
+import time
 import asyncio
-from typing import Dict, Any, Optional, List
+import argparse
+import io
+import importlib.util
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, asdict
+from itertools import islice
+from types import MappingProxyType
 import httpx
 from dotenv import load_dotenv
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # Optional - the stdlib json module is used instead
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 API_BASE = "https://api.rocket.net/v1"
+REQUIRED_ENV = ("ROCKETNET_BEARER_TOKEN",)
+
+# Report every missing required variable at once, not just the first
+missing_env = [name for name in REQUIRED_ENV if not os.getenv(name)]
+if missing_env:
+    for name in missing_env:
+        print(f"❌ Error: {name} not found in .env file")
+    print("Please copy .env.template to .env and add your bearer token")
+    sys.exit(1)
+
 BEARER_TOKEN = os.getenv("ROCKETNET_BEARER_TOKEN")
 SITE_ID = os.getenv("ROCKETNET_SITE_ID")
 BACKUP_ID = os.getenv("ROCKETNET_BACKUP_ID")
 DOMAIN_ID = os.getenv("ROCKETNET_DOMAIN_ID")
 INVOICE_ID = os.getenv("ROCKETNET_INVOICE_ID")
 
-if not BEARER_TOKEN:
-    print("❌ Error: ROCKETNET_BEARER_TOKEN not found in .env file")
-    print("Please copy .env.template to .env and add your bearer token")
-    sys.exit(1)
+# Optional IDs, filled into the {NAME} placeholders of endpoint templates
+ENDPOINT_IDS: Dict[str, Optional[str]] = {
+    "SITE_ID": SITE_ID,
+    "BACKUP_ID": BACKUP_ID,
+    "DOMAIN_ID": DOMAIN_ID,
+    "INVOICE_ID": INVOICE_ID,
+}
+
+# Sent with every request (set once on the shared client)
+HEADERS = {
+    "Authorization": f"Bearer {BEARER_TOKEN}",
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+# Maximum number of endpoint requests in flight at once
+MAX_CONCURRENCY = 10
+
+# One pooled client is shared by every request; all of them go to the same
+# host, so HTTP/2 (when h2 is installed) multiplexes them over one connection
+CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+CLIENT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+CLIENT_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Bodies larger than this (log endpoints can be huge) are not read in full;
+# their shape is taken from the first byte instead
+MAX_BODY_BYTES = 512 * 1024
+
+# Rate-limited (429/503) and dropped requests are retried, waiting for the
+# server's Retry-After (capped) or else backing off exponentially
+MAX_ATTEMPTS = 4
+RETRY_STATUSES = (429, 503)
+MAX_RETRY_WAIT = 30.0
+
+# Successful results are cached on disk so repeat runs skip the network
+CACHE_FILE = ".api_test_cache.json"
+CACHE_TTL = 3600
 
 # Test results storage
 test_results = []
 
+# "METHOD url" -> {"stored_at": epoch seconds, "result": test result,
+#                  "etag": ..., "last_modified": ...}
+response_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def parse_json(content: bytes) -> Any:
+    """Parse a JSON document (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data as indented JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def write_atomic(path: str, content: bytes) -> None:
+    """Write a file in one go, so an interrupted run never leaves half of it."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def load_cache() -> Dict[str, Dict[str, Any]]:
+    """Load cached results from a previous run, if any."""
+    try:
+        with open(CACHE_FILE, 'rb') as f:
+            return parse_json(f.read())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache: Dict[str, Dict[str, Any]]) -> None:
+    """Write cached results for the next run."""
+    write_atomic(CACHE_FILE, dump_json(cache))
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a response (attempt counts from 0)."""
+    try:
+        return min(float(response.headers["Retry-After"]), MAX_RETRY_WAIT)
+    except (KeyError, ValueError):
+        # Missing, or an HTTP date rather than seconds
+        return 2 ** attempt
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointSpec:
+    """An endpoint to test; its endpoint is a template like "/sites/{SITE_ID}"."""
+    method: str
+    endpoint: str
+    name: str
+    category: str
+    requires: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        """The endpoint with its ID placeholders filled in."""
+        return self.endpoint.format(**ENDPOINT_IDS)
+
+    def fields(self) -> Dict[str, Any]:
+        """The spec as result fields, with the endpoint filled in."""
+        return {**asdict(self), "endpoint": self.path}
+
+
 # Define all endpoints to test
-ENDPOINTS = [
+ENDPOINTS: Tuple[EndpointSpec, ...] = (
     # Sites endpoints
-    {"method": "GET", "endpoint": "/sites", "name": "List sites", "category": "Sites"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}", "name": "Get site", "category": "Sites", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": "/sites/locations", "name": "List locations", "category": "Sites"},
-    {"method": "GET", "endpoint": "/sites/templates", "name": "List templates", "category": "Sites"},
+    EndpointSpec("GET", "/sites", "List sites", "Sites"),
+    EndpointSpec("GET", "/sites/{SITE_ID}", "Get site", "Sites", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/locations", "List locations", "Sites"),
+    EndpointSpec("GET", "/sites/templates", "List templates", "Sites"),
 
     # WordPress endpoints
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/plugins", "name": "List plugins", "category": "WordPress", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/themes", "name": "List themes", "category": "WordPress", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/plugins/search?search=contact", "name": "Search plugins", "category": "WordPress", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/themes/search?search=twenty", "name": "Search themes", "category": "WordPress", "requires": "SITE_ID"},
+    EndpointSpec("GET", "/sites/{SITE_ID}/plugins", "List plugins", "WordPress", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/themes", "List themes", "WordPress", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/plugins/search?search=contact", "Search plugins", "WordPress", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/themes/search?search=twenty", "Search themes", "WordPress", requires="SITE_ID"),
 
     # Access endpoints
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/ssh-keys", "name": "List SSH keys", "category": "Access", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/ftp-accounts", "name": "List FTP accounts", "category": "Access", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/file-manager/files?path=/", "name": "List files", "category": "Access", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/password-protection/users", "name": "List protected users", "category": "Access", "requires": "SITE_ID"},
+    EndpointSpec("GET", "/sites/{SITE_ID}/ssh-keys", "List SSH keys", "Access", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/ftp-accounts", "List FTP accounts", "Access", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/file-manager/files?path=/", "List files", "Access", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/password-protection/users", "List protected users", "Access", requires="SITE_ID"),
 
     # Billing endpoints
-    {"method": "GET", "endpoint": "/billing/products", "name": "List products/plans", "category": "Billing"},
-    {"method": "GET", "endpoint": "/billing/invoices", "name": "List invoices", "category": "Billing"},
-    {"method": "GET", "endpoint": "/billing/payment-methods", "name": "List payment methods", "category": "Billing"},
-    {"method": "GET", "endpoint": "/billing/addresses", "name": "List billing addresses", "category": "Billing"},
+    EndpointSpec("GET", "/billing/products", "List products/plans", "Billing"),
+    EndpointSpec("GET", "/billing/invoices", "List invoices", "Billing"),
+    EndpointSpec("GET", "/billing/payment-methods", "List payment methods", "Billing"),
+    EndpointSpec("GET", "/billing/addresses", "List billing addresses", "Billing"),
 
     # Account endpoints
-    {"method": "GET", "endpoint": "/account/users", "name": "List account users", "category": "Account"},
-    {"method": "GET", "endpoint": "/account/visitors", "name": "Get visitor stats", "category": "Account"},
-    {"method": "GET", "endpoint": "/account/usage", "name": "Get usage stats", "category": "Account"},
+    EndpointSpec("GET", "/account/users", "List account users", "Account"),
+    EndpointSpec("GET", "/account/visitors", "Get visitor stats", "Account"),
+    EndpointSpec("GET", "/account/usage", "Get usage stats", "Account"),
 
     # Domain endpoints
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/domains", "name": "List domains", "category": "Domains", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/maindomain", "name": "Get main domain", "category": "Domains", "requires": "SITE_ID"},
+    EndpointSpec("GET", "/sites/{SITE_ID}/domains", "List domains", "Domains", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/maindomain", "Get main domain", "Domains", requires="SITE_ID"),
 
     # Backup endpoints
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/backups", "name": "List backups", "category": "Backups", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/cloud-backups", "name": "List cloud backups", "category": "Backups", "requires": "SITE_ID"},
+    EndpointSpec("GET", "/sites/{SITE_ID}/backups", "List backups", "Backups", requires="SITE_ID"),
+    EndpointSpec("GET", "/sites/{SITE_ID}/cloud-backups", "List cloud backups", "Backups", requires="SITE_ID"),
 
     # Analytics endpoints
-    {"method": "GET", "endpoint": f"/sites/{SITE_ID}/access-logs", "name": "List access logs", "category": "Analytics", "requires": "SITE_ID"},
-    {"method": "GET", "endpoint": f"/reporting/sites/{SITE_ID}/visitors", "name": "Visitor report", "category": "Analytics", "requires": "SITE_ID"},
-]
-
-async def test_endpoint(client: httpx.AsyncClient, endpoint_config: Dict[str, Any]) -> Dict[str, Any]:
-    """Test a single endpoint and analyze its response structure."""
-
-    # Skip if required variable is missing
-    if endpoint_config.get("requires"):
-        required_var = endpoint_config["requires"]
-        if required_var == "SITE_ID" and not SITE_ID:
-            return {
-                **endpoint_config,
-                "status": "SKIPPED",
-                "reason": "SITE_ID not provided",
-                "response_type": None,
-                "is_array": None
-            }
+    EndpointSpec("GET", "/sites/{SITE_ID}/access-logs", "List access logs", "Analytics", requires="SITE_ID"),
+    EndpointSpec("GET", "/reporting/sites/{SITE_ID}/visitors", "Visitor report", "Analytics", requires="SITE_ID"),
+)
+
+# Endpoints grouped by category, in definition order
+BY_CATEGORY: Dict[str, Tuple[EndpointSpec, ...]] = {
+    category: tuple(spec for spec in ENDPOINTS if spec.category == category)
+    for category in dict.fromkeys(spec.category for spec in ENDPOINTS)
+}
+
+# Why an endpoint can't run: the ID it needs isn't configured
+SKIP_REASONS: Dict[str, str] = {
+    name: f"{name} not provided"
+    for name, value in ENDPOINT_IDS.items()
+    if not value
+}
+
+# Split once at load, so skipped endpoints never become tasks
+RUNNABLE: Tuple[EndpointSpec, ...] = tuple(spec for spec in ENDPOINTS if spec.requires not in SKIP_REASONS)
+PRE_SKIPPED: Tuple[EndpointSpec, ...] = tuple(spec for spec in ENDPOINTS if spec.requires in SKIP_REASONS)
+
+# Map category to likely file
+FILE_MAP = MappingProxyType({
+    'Sites': 'rocketnet-sites/src/tools/sites.py',
+    'WordPress': 'rocketnet-wordpress/src/tools/wordpress.py',
+    'Access': 'rocketnet-access/src/tools/access.py',
+    'Billing': 'rocketnet-billing/src/tools/billing.py',
+    'Account': 'rocketnet-billing/src/tools/billing.py',
+    'Domains': 'rocketnet-domains/src/tools/domains.py',
+    'Backups': 'rocketnet-backups/src/tools/backups.py',
+    'Analytics': 'rocketnet-analytics/src/tools/analytics.py',
+})
+
+async def test_endpoint(client: httpx.AsyncClient, spec: EndpointSpec) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Test a single endpoint and analyze its response structure.
+
+    Returns the result and its output lines; the caller prints them once all
+    endpoints are done, so concurrent tests don't interleave on stdout.
+    """
+    log: List[str] = []
+    # Built once; whichever outcome applies fills in its fields
+    result = spec.fields()
+    path = result["endpoint"]
+
+    cache_key = f"{spec.method} {API_BASE}{path}"
+    cached = response_cache.get(cache_key)
+    if cached and time.time() - cached["stored_at"] < CACHE_TTL:
+        log.append(f"♻️  {spec.name}: cached")
+        return {**cached["result"], "cached": True}, log
+
+    # Revalidate a stale entry with its validators; a 304 means it still holds
+    conditional_headers = {}
+    if cached:
+        if cached.get("etag"):
+            conditional_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = cached["last_modified"]
 
     try:
-        headers = {
-            "Authorization": f"Bearer {BEARER_TOKEN}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-
-        url = f"{API_BASE}{endpoint_config['endpoint']}"
-        response = await client.request(
-            method=endpoint_config["method"],
-            url=url,
-            headers=headers,
-            timeout=10.0
-        )
+        # Auth headers, base URL and timeout are set on the shared client.
+        # Streamed so only successful bodies are downloaded - a 304 or an
+        # error response is judged by its status alone.
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                async with client.stream(
+                    method=spec.method,
+                    url=path,
+                    headers=conditional_headers or None
+                ) as response:
+                    if response.status_code == 200:
+                        content = bytearray()
+                        truncated = False
+                        async for chunk in response.aiter_bytes():
+                            content.extend(chunk)
+                            if len(content) > MAX_BODY_BYTES:
+                                truncated = True
+                                break
+            except httpx.TransportError:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+                delay = 2 ** attempt
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                    break
+                delay = retry_delay(response, attempt)
+            await asyncio.sleep(delay)
+
+        if response.status_code == 304 and cached:
+            cached["stored_at"] = time.time()
+            log.append(f"♻️  {spec.name}: not modified")
+            return {**cached["result"], "cached": True}, log
 
         if response.status_code == 200:
             try:
-                data = response.json()
-
-                # Analyze response structure
-                is_array = isinstance(data, list)
-                response_type = "array" if is_array else "object"
-
-                # For objects, check what keys it has
-                top_keys = []
-                potential_array_keys = []
-                actual_data_location = None
-                if isinstance(data, dict):
-                    top_keys = list(data.keys())[:5]  # First 5 keys
-                    # Check for keys that contain arrays
-                    for key, value in data.items():
-                        if isinstance(value, list):
-                            potential_array_keys.append(key)
-                            # Check if this is the main data array
-                            if key == "result":
-                                actual_data_location = "result"
-                            elif key == "data":
-                                actual_data_location = "data"
-
-                result = {
-                    **endpoint_config,
-                    "status": "SUCCESS",
-                    "status_code": response.status_code,
-                    "response_type": response_type,
-                    "is_array": is_array,
-                    "top_keys": top_keys if not is_array else None,
-                    "array_keys": potential_array_keys if potential_array_keys else None,
-                    "data_location": actual_data_location,
-                    "sample_count": len(data) if is_array else len(data.get(actual_data_location, [])) if actual_data_location else None
+                if truncated:
+                    # Too big to parse; '[' or '{' still tells array from object
+                    opening = content.lstrip()[:1]
+                    if opening not in (b"[", b"{"):
+                        raise json.JSONDecodeError("Expecting '[' or '{'", opening.decode(errors="replace"), 0)
+                    is_array = opening == b"["
+                    response_type = "array" if is_array else "object"
+                    result.update(
+                        status="SUCCESS",
+                        status_code=response.status_code,
+                        response_type=response_type,
+                        is_array=is_array,
+                        top_keys=None,
+                        array_keys=None,
+                        data_location=None,
+                        sample_count=None,
+                        truncated=True
+                    )
+                    emoji = "🔴" if is_array else "🟢"
+                    log.append(f"{emoji} {spec.name}: {response_type}")
+                    log.append(f"   → Body over {MAX_BODY_BYTES // 1024} KB, only its shape was checked")
+                else:
+                    data = parse_json(content)
+
+                    # Analyze response structure
+                    is_array = isinstance(data, list)
+                    response_type = "array" if is_array else "object"
+
+                    # For objects, check what keys it has
+                    top_keys = []
+                    potential_array_keys = []
+                    actual_data_location = None
+                    if isinstance(data, dict):
+                        top_keys = list(islice(data, 5))  # First 5 keys
+                        # Check for keys that contain arrays
+                        for key, value in data.items():
+                            if isinstance(value, list):
+                                potential_array_keys.append(key)
+                                # Check if this is the main data array
+                                if key == "result":
+                                    actual_data_location = "result"
+                                elif key == "data":
+                                    actual_data_location = "data"
+
+                    result.update(
+                        status="SUCCESS",
+                        status_code=response.status_code,
+                        response_type=response_type,
+                        is_array=is_array,
+                        top_keys=top_keys if not is_array else None,
+                        array_keys=potential_array_keys if potential_array_keys else None,
+                        data_location=actual_data_location,
+                        sample_count=len(data) if is_array else len(data.get(actual_data_location, [])) if actual_data_location else None
+                    )
+
+                    # Print immediate feedback
+                    emoji = "🔴" if is_array else "🟡" if actual_data_location == "result" else "🟢"
+                    log.append(f"{emoji} {spec.name}: {response_type}")
+                    if is_array:
+                        log.append(f"   → Returns direct array with {len(data)} items")
+                    elif actual_data_location:
+                        count = len(data.get(actual_data_location, []))
+                        log.append(f"   → Data in '{actual_data_location}' key: {count} items")
+                    elif potential_array_keys:
+                        log.append(f"   → Object with array keys: {', '.join(potential_array_keys)}")
+
+                response_cache[cache_key] = {
+                    "stored_at": time.time(),
+                    "result": result,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified")
                 }
+                return result, log
 
-                # Print immediate feedback
-                emoji = "🔴" if is_array else "🟡" if actual_data_location == "result" else "🟢"
-                print(f"{emoji} {endpoint_config['name']}: {response_type}")
-                if is_array:
-                    print(f"   → Returns direct array with {len(data)} items")
-                elif actual_data_location:
-                    count = len(data.get(actual_data_location, []))
-                    print(f"   → Data in '{actual_data_location}' key: {count} items")
-                elif potential_array_keys:
-                    print(f"   → Object with array keys: {', '.join(potential_array_keys)}")
-
-                return result
-
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             except json.JSONDecodeError:
-                return {
-                    **endpoint_config,
-                    "status": "ERROR",
-                    "status_code": response.status_code,
-                    "error": "Invalid JSON response",
-                    "response_type": None,
-                    "is_array": None
-                }
+                result.update(
+                    status="ERROR",
+                    status_code=response.status_code,
+                    error="Invalid JSON response",
+                    response_type=None,
+                    is_array=None
+                )
+                return result, log
         else:
-            return {
-                **endpoint_config,
-                "status": "HTTP_ERROR",
-                "status_code": response.status_code,
-                "error": f"HTTP {response.status_code}",
-                "response_type": None,
-                "is_array": None
-            }
+            result.update(
+                status="HTTP_ERROR",
+                status_code=response.status_code,
+                error=f"HTTP {response.status_code}",
+                response_type=None,
+                is_array=None
+            )
+            return result, log
 
     except httpx.RequestError as e:
-        return {
-            **endpoint_config,
-            "status": "NETWORK_ERROR",
-            "error": str(e),
-            "response_type": None,
-            "is_array": None
-        }
-
-async def run_tests():
+        result.update(
+            status="NETWORK_ERROR",
+            error=str(e),
+            response_type=None,
+            is_array=None
+        )
+        return result, log
+
+async def run_tests(use_cache: bool = True):
     """Run all endpoint tests."""
+    if use_cache:
+        response_cache.update(load_cache())
+
     print("=" * 60)
     print("🚀 Rocket.net API Endpoint Structure Test")
     print("=" * 60)
     print(f"API Base: {API_BASE}")
     print(f"Site ID: {SITE_ID if SITE_ID else 'Not provided'}")
-    print(f"Total endpoints to test: {len(ENDPOINTS)}")
+    print(f"Total endpoints to test: {len(RUNNABLE)} ({len(PRE_SKIPPED)} skipped)")
+    print(f"Result cache: {CACHE_FILE} ({CACHE_TTL}s)" if use_cache else "Result cache: disabled")
     print("=" * 60 + "\n")
 
-    async with httpx.AsyncClient() as client:
-        # Group by category for better output
-        categories = {}
-        for endpoint in ENDPOINTS:
-            category = endpoint.get("category", "Other")
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(endpoint)
-
-        # Test each category
-        for category, endpoints in categories.items():
-            print(f"\n📁 Testing {category} Endpoints")
-            print("-" * 40)
+    print(f"📡 Testing endpoints ({MAX_CONCURRENCY} at a time)...")
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def guarded(client: httpx.AsyncClient, spec: EndpointSpec) -> Tuple[Dict[str, Any], List[str]]:
+        async with semaphore:
+            return await test_endpoint(client, spec)
+
+    # (method, endpoint) -> the test of the first spec sending that request;
+    # specs that repeat it share its outcome instead of sending it again
+    first_tests: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    async def deduplicated(client: httpx.AsyncClient, spec: EndpointSpec) -> Tuple[Dict[str, Any], List[str]]:
+        key = (spec.method, spec.path)
+        first = first_tests.get(key)
+        if first is None:
+            first = first_tests[key] = asyncio.ensure_future(guarded(client, spec))
+            return await first
+        result, _ = await first
+        return {**result, **spec.fields()}, [f"♻️  {spec.name}: same request as {result['name']}"]
+
+    async with httpx.AsyncClient(
+        base_url=API_BASE,
+        http2=CLIENT_HTTP2,
+        limits=CLIENT_LIMITS,
+        timeout=CLIENT_TIMEOUT,
+        headers=HEADERS
+    ) as client:
+        # Requests are I/O bound, so run them concurrently
+        results = await asyncio.gather(
+            *(deduplicated(client, spec) for spec in RUNNABLE),
+            return_exceptions=True
+        )
+    outcomes = dict(zip(RUNNABLE, results))
+
+    # Record results in ENDPOINTS order; unexpected failures become errors
+    logs = {}
+    for spec in ENDPOINTS:
+        outcome = outcomes.get(spec)
+        if outcome is None:
+            result = {
+                **asdict(spec),
+                "status": "SKIPPED",
+                "reason": SKIP_REASONS[spec.requires],
+                "response_type": None,
+                "is_array": None
+            }
+            log = []
+        elif isinstance(outcome, Exception):
+            result = {
+                **spec.fields(),
+                "status": "ERROR",
+                "error": str(outcome),
+                "response_type": None,
+                "is_array": None
+            }
+            log = []
+        else:
+            result, log = outcome
+        if not log:
+            # Skips and errors print nothing themselves
+            emoji = "⏭️ " if result["status"] == "SKIPPED" else "❌"
+            log = [f"{emoji} {result['name']}: {result.get('reason') or result.get('error')}"]
+        test_results.append(result)
+        logs[spec] = log
 
-            for endpoint in endpoints:
-                result = await test_endpoint(client, endpoint)
-                test_results.append(result)
+    if use_cache:
+        save_cache(response_cache)
 
-    # Generate summary report
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY REPORT")
-    print("=" * 60)
+    # Write each category's output in one go
+    for category, specs in BY_CATEGORY.items():
+        lines = [line for spec in specs for line in logs[spec]]
+        sys.stdout.write(f"\n📁 {category} Endpoints\n" + "-" * 40 + "\n" + "\n".join(lines) + "\n")
 
-    # Count results
-    array_endpoints = [r for r in test_results if r.get("is_array") == True]
-    object_endpoints = [r for r in test_results if r.get("is_array") == False]
-    skipped = [r for r in test_results if r.get("status") == "SKIPPED"]
-    errors = [r for r in test_results if r.get("status") in ["ERROR", "HTTP_ERROR", "NETWORK_ERROR"]]
+    # Build the summary and fixes sections, then write them out at once
+    out = io.StringIO()
 
-    print(f"\n✅ Successfully tested: {len(array_endpoints) + len(object_endpoints)}")
-    print(f"🔴 Direct arrays: {len(array_endpoints)}")
-    print(f"🟢 Objects: {len(object_endpoints)}")
-    print(f"⏭️  Skipped: {len(skipped)}")
-    print(f"❌ Errors: {len(errors)}")
+    # Generate summary report
+    print("\n" + "=" * 60, file=out)
+    print("📊 SUMMARY REPORT", file=out)
+    print("=" * 60, file=out)
+
+    # Sort results into their groups in one pass
+    array_endpoints, object_endpoints, skipped, errors = [], [], [], []
+    for r in test_results:
+        status = r.get("status")
+        if status == "SKIPPED":
+            skipped.append(r)
+        elif status in ("ERROR", "HTTP_ERROR", "NETWORK_ERROR"):
+            errors.append(r)
+        elif r.get("is_array"):
+            array_endpoints.append(r)
+        elif r.get("is_array") is False:
+            object_endpoints.append(r)
+
+    print(f"\n✅ Successfully tested: {len(array_endpoints) + len(object_endpoints)}", file=out)
+    print(f"🔴 Direct arrays: {len(array_endpoints)}", file=out)
+    print(f"🟢 Objects: {len(object_endpoints)}", file=out)
+    print(f"⏭️  Skipped: {len(skipped)}", file=out)
+    print(f"❌ Errors: {len(errors)}", file=out)
 
     if array_endpoints:
-        print("\n🔴 Endpoints returning DIRECT ARRAYS (need fixing):")
-        print("-" * 40)
+        print("\n🔴 Endpoints returning DIRECT ARRAYS (need fixing):", file=out)
+        print("-" * 40, file=out)
         for r in array_endpoints:
             count = f" ({r['sample_count']} items)" if r.get('sample_count') is not None else ""
-            print(f"  • {r['endpoint']}{count}")
+            print(f"  • {r['endpoint']}{count}", file=out)
 
     if object_endpoints:
-        print("\n🟢 Endpoints returning OBJECTS (current code handles these):")
-        print("-" * 40)
+        print("\n🟢 Endpoints returning OBJECTS (current code handles these):", file=out)
+        print("-" * 40, file=out)
         for r in object_endpoints:
             keys_info = ""
             if r.get('array_keys'):
                 keys_info = f" [arrays in: {', '.join(r['array_keys'])}]"
-            print(f"  • {r['endpoint']}{keys_info}")
+            print(f"  • {r['endpoint']}{keys_info}", file=out)
 
     # Save detailed report to file
-    report_file = f"api_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_file, 'w') as f:
-        json.dump(test_results, f, indent=2, default=str)
+    report_file = f"api_test_report_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    write_atomic(report_file, dump_json(test_results))
 
-    print(f"\n📄 Detailed report saved to: {report_file}")
+    print(f"\n📄 Detailed report saved to: {report_file}", file=out)
 
     # Generate fixes needed
     if array_endpoints:
-        print("\n🔧 FIXES NEEDED")
-        print("=" * 60)
-        print("The following files need array handling updates:\n")
+        print("\n🔧 FIXES NEEDED", file=out)
+        print("=" * 60, file=out)
+        print("The following files need array handling updates:\n", file=out)
 
         # Map endpoints to files
         fixes_needed = {}
         for r in array_endpoints:
             endpoint = r['endpoint']
             category = r.get('category', 'Unknown')
-
-            # Map category to likely file
-            file_map = {
-                'Sites': 'rocketnet-sites/src/tools/sites.py',
-                'WordPress': 'rocketnet-wordpress/src/tools/wordpress.py',
-                'Access': 'rocketnet-access/src/tools/access.py',
-                'Billing': 'rocketnet-billing/src/tools/billing.py',
-                'Account': 'rocketnet-billing/src/tools/billing.py',
-                'Domains': 'rocketnet-domains/src/tools/domains.py',
-                'Backups': 'rocketnet-backups/src/tools/backups.py',
-                'Analytics': 'rocketnet-analytics/src/tools/analytics.py',
-            }
-
-            file_path = file_map.get(category, 'Unknown')
+            file_path = FILE_MAP.get(category, 'Unknown')
             if file_path not in fixes_needed:
                 fixes_needed[file_path] = []
             fixes_needed[file_path].append(endpoint)
 
         for file_path, endpoints in fixes_needed.items():
-            print(f"\n📝 {file_path}:")
+            print(f"\n📝 {file_path}:", file=out)
             for endpoint in endpoints:
-                print(f"   • {endpoint}")
+                print(f"   • {endpoint}", file=out)
+
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
-    asyncio.run(run_tests())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"ignore and clear cached results in {CACHE_FILE}"
+    )
+    args = parser.parse_args()
+
+    if args.no_cache and os.path.exists(CACHE_FILE):
+        os.remove(CACHE_FILE)
+
+    # uvloop is optional (not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    asyncio.run(run_tests(use_cache=not args.no_cache))